@@ -1,4 +1,4 @@
-from .syllabreak import Syllabreak
+from .syllabreak import Syllabreak, WordSyllables
 
 __version__ = "0.4.0"
-__all__ = ["Syllabreak"]
+__all__ = ["Syllabreak", "WordSyllables"]
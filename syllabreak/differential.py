@@ -0,0 +1,249 @@
+"""Differential testing of alternative syllabification engines against the reference one.
+
+An engine is any callable taking a word and a LanguageRule and returning the
+ascending character offsets of syllable boundaries, like
+WordSyllabifier.boundary_offsets. `run_differential` feeds both engines the same
+generated and corpus-derived words for every rule, times them, and shrinks each
+disagreement to a minimal word that still reproduces it.
+"""
+
+import random
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Optional
+
+from .language_rule import LanguageRule
+from .syllabreak import Syllabreak
+from .word_syllabifier import WordSyllabifier
+
+Engine = Callable[[str, LanguageRule], list[int]]
+
+
+def reference_engine(word: str, rule: LanguageRule) -> list[int]:
+    """The current implementation, used as the oracle."""
+    return WordSyllabifier(word, rule, "\u00ad").boundary_offsets()
+
+
+@dataclass
+class Mismatch:
+    lang: str
+    word: str
+    minimal: str
+    expected: list[int]
+    actual: object
+
+
+@dataclass
+class DifferentialReport:
+    words_checked: int = 0
+    reference_time: float = 0.0
+    engine_time: float = 0.0
+    mismatches: list[Mismatch] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.mismatches
+
+
+def _run(engine: Engine, word: str, rule: LanguageRule) -> object:
+    """Run the engine, turning an exception into a comparable result."""
+    try:
+        return engine(word, rule)
+    except Exception as e:
+        return e
+
+
+def _same(expected: object, actual: object) -> bool:
+    if isinstance(expected, Exception) or isinstance(actual, Exception):
+        return type(expected) is type(actual)
+    return list(expected) == list(actual)
+
+
+def _differs(engine: Engine, reference: Engine, word: str, rule: LanguageRule) -> bool:
+    return not _same(_run(reference, word, rule), _run(engine, word, rule))
+
+
+def shrink(word: str, rule: LanguageRule, engine: Engine, reference: Engine = reference_engine) -> str:
+    """Reduce a word the engines disagree on to a locally minimal one.
+
+    Removes ever smaller chunks of characters while the disagreement persists,
+    then tries lowercasing the result.
+    """
+    chunk = max(len(word) // 2, 1)
+    while chunk:
+        i = 0
+        while i < len(word):
+            candidate = word[:i] + word[i + chunk :]
+            if candidate and _differs(engine, reference, candidate, rule):
+                word = candidate
+            else:
+                i += chunk
+        chunk //= 2
+
+    lower = word.lower()
+    if lower != word and len(lower) == len(word) and _differs(engine, reference, lower, rule):
+        word = lower
+    return word
+
+
+class WordGenerator:
+    """Generates words exercising the features of one language rule.
+
+    Words are built from syllables over the rule's alphabet, digraphs, clusters and
+    modifiers, with targeted cases for syllabic consonants, final semivowels and
+    protected final sequences followed by suffixes, plus unstructured random strings.
+    """
+
+    def __init__(self, rule: LanguageRule, rng: random.Random):
+        self.rule = rule
+        self.rng = rng
+        self.vowels = sorted(rule.vowels) + sorted(rule.digraph_vowels)
+        self.consonants = sorted(rule.consonants) + sorted(rule.dont_split_digraphs)
+        self.clusters = sorted(rule.clusters_keep_next) + sorted(rule.clusters_only_after_long)
+        self.alphabet = sorted(set().union(*(getattr(rule, name) for name in LanguageRule.CHAR_FIELDS)))
+
+    def _pick(self, options) -> str:
+        return self.rng.choice(options) if options else ""
+
+    def _onset(self) -> str:
+        roll = self.rng.random()
+        if roll < 0.25 and self.clusters:
+            return self._pick(self.clusters)
+        if roll < 0.35:
+            return self._pick(self.consonants) + self._pick(self.consonants)
+        if roll < 0.85:
+            return self._pick(self.consonants)
+        return ""
+
+    def _modifier(self) -> str:
+        options = sorted(self.rule.modifiers_attach_left) + sorted(self.rule.modifiers_separators)
+        options += sorted(self.rule.modifiers_attach_right)
+        return self._pick(options) if self.rng.random() < 0.3 else ""
+
+    def syllabic(self) -> str:
+        """Word built from syllables, optionally with a modifier after an onset."""
+        parts = []
+        for _ in range(self.rng.randint(1, 5)):
+            parts.append(self._onset())
+            parts.append(self._modifier())
+            parts.append(self._pick(self.vowels))
+        if self.rng.random() < 0.4:
+            parts.append(self._pick(self.consonants))
+        return "".join(parts)
+
+    def syllabic_consonant(self) -> str:
+        """Consonant-only core such as Serbian "prst" or "vrba"."""
+        core = self._pick(self.consonants) + self._pick(sorted(self.rule.syllabic_consonants))
+        core += self._pick(self.consonants)
+        prefix = self._pick(self.consonants) if self.rng.random() < 0.5 else ""
+        suffix = self._pick(self.vowels) if self.rng.random() < 0.5 else ""
+        return prefix + core + suffix
+
+    def final_sequence(self) -> str:
+        """Protected final sequence, optionally followed by a suffix (care, care-less, par-ent)."""
+        sequence = self._pick(sorted(self.rule.final_sequences_keep))
+        suffixes = sorted(self.rule.suffixes_keep_vre) + sorted(self.rule.suffixes_break_vre)
+        if self.rng.random() < 0.6:
+            # drop the final vowel of the sequence when the suffix brings its own
+            suffix = self._pick(suffixes)
+            sequence = sequence[:-1] + suffix if suffix in self.rule.suffixes_break_vre else sequence + suffix
+        return self.syllabic() + sequence
+
+    def final_semivowel(self) -> str:
+        return self.syllabic() + self._pick(self.consonants) + self._pick(sorted(self.rule.final_semivowels))
+
+    def random_string(self) -> str:
+        return "".join(self.rng.choice(self.alphabet) for _ in range(self.rng.randint(1, 12)))
+
+    def word(self) -> str:
+        makers = [self.syllabic, self.syllabic, self.random_string]
+        if self.rule.syllabic_consonants:
+            makers.append(self.syllabic_consonant)
+        if self.rule.final_sequences_keep:
+            makers.append(self.final_sequence)
+        if self.rule.final_semivowels:
+            makers.append(self.final_semivowel)
+        word = self.rng.choice(makers)() or self.random_string()
+
+        roll = self.rng.random()
+        if roll < 0.1:
+            word = word.upper()
+        elif roll < 0.2:
+            word = word.capitalize()
+        return word
+
+    def mutate(self, word: str) -> str:
+        """Replace one character of a corpus word with a random letter of the alphabet."""
+        i = self.rng.randrange(len(word))
+        return word[:i] + self.rng.choice(self.alphabet) + word[i + 1 :]
+
+
+def corpus_words(texts: Iterable[str], rule: LanguageRule) -> list[str]:
+    """Distinct words of the texts written entirely in the rule's alphabet."""
+    known = set().union(*(getattr(rule, name) for name in LanguageRule.CHAR_FIELDS))
+    words = {}
+    for text in texts:
+        for start, end in Syllabreak._iter_word_spans(text):
+            word = text[start:end]
+            if all(c in known for c in word.lower()):
+                words[word] = None
+    return list(words)
+
+
+def generate_words(rule: LanguageRule, count: int, seed: int = 0, corpus: Optional[Iterable[str]] = None) -> list[str]:
+    """Generate `count` words for the rule, plus corpus words and mutations of them."""
+    rng = random.Random(f"{seed}:{rule.lang}")
+    generator = WordGenerator(rule, rng)
+    words = [generator.word() for _ in range(count)]
+    if corpus is not None:
+        found = corpus_words(corpus, rule)
+        words += found
+        words += [generator.mutate(word) for word in found]
+    return words
+
+
+def run_differential(
+    engine: Engine,
+    rules: Optional[list[LanguageRule]] = None,
+    words_per_rule: int = 1000,
+    seed: int = 0,
+    corpus: Optional[Iterable[str]] = None,
+    reference: Engine = reference_engine,
+) -> DifferentialReport:
+    """Compare the engine against the reference on words generated for every rule.
+
+    Args:
+        engine: Engine under test
+        rules: Rules to test, all bundled rules by default
+        words_per_rule: Number of generated words per rule
+        seed: Seed for word generation; the same seed yields the same words
+        corpus: Optional texts whose words (and mutations of them) are tested too
+        reference: Oracle engine
+    """
+    if rules is None:
+        rules = Syllabreak().meta_rule.rules
+    corpus = list(corpus) if corpus is not None else None
+
+    report = DifferentialReport()
+    for rule in rules:
+        words = generate_words(rule, words_per_rule, seed, corpus)
+
+        start = time.perf_counter()
+        expected = [_run(reference, word, rule) for word in words]
+        report.reference_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        actual = [_run(engine, word, rule) for word in words]
+        report.engine_time += time.perf_counter() - start
+
+        report.words_checked += len(words)
+        seen = set()
+        for i, word in enumerate(words):
+            if word in seen or _same(expected[i], actual[i]):
+                continue
+            seen.add(word)
+            minimal = shrink(word, rule, engine, reference)
+            report.mismatches.append(Mismatch(rule.lang, word, minimal, expected[i], actual[i]))
+
+    return report
@@ -0,0 +1,210 @@
+"""Persistent cache of syllable boundaries that survives restarts.
+
+Every language rule gets its own append-only file named after a hash of the
+rule's content, so editing rules.yaml (or loading a different rule table) moves
+a language to a fresh file and stale entries are never read. A line holds a
+lowercased word, its boundary offsets and a checksum of both:
+
+    hello\t3\t1f0b6e2a
+
+New entries are buffered and appended in a single write under an exclusive
+lock, and readers skip every line that does not parse or fails its checksum,
+so any number of processes can share a cache directory. Loading a file touches
+it, and files nobody has loaded or extended for a while (rules that changed)
+are removed when the cache is warmed.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+import weakref
+import zlib
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Optional, Union
+
+from .language_rule import LanguageRule
+
+try:
+    import fcntl
+except ImportError:  # Windows: appends are not locked, torn lines are skipped on load
+    fcntl = None
+
+# Bump when a change to the syllabifier changes its output for unchanged rules
+CACHE_VERSION = 1
+
+
+def rule_fingerprint(rule: LanguageRule) -> str:
+    """Hash of everything in the rule that affects syllabification."""
+    content = {name: sorted(getattr(rule, name)) for name in LanguageRule.CHAR_FIELDS + LanguageRule.STRING_FIELDS}
+    content["lang"] = rule.lang
+    content["split_hiatus"] = bool(rule.split_hiatus)
+    content["version"] = CACHE_VERSION
+    return hashlib.sha256(json.dumps(content, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _format_line(word: str, offsets: list[int]) -> bytes:
+    body = f"{word}\t{','.join(map(str, offsets))}".encode()
+    return body + f"\t{zlib.crc32(body):08x}\n".encode()
+
+
+def _parse_line(line: bytes) -> Optional[tuple[str, list[int]]]:
+    """Word and offsets of a cache line, or None if the line is damaged."""
+    body, sep, checksum = line.rpartition(b"\t")
+    if not sep or checksum != f"{zlib.crc32(body):08x}".encode():
+        return None
+    try:
+        word, offsets = body.decode("utf-8").split("\t")
+        return word, [int(offset) for offset in offsets.split(",")] if offsets else []
+    except ValueError:
+        return None
+
+
+def _append(path: Path, lines: list[bytes]):
+    """Append whole lines to the file in a single write."""
+    fd = os.open(path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        data = b"".join(lines)
+        # A writer that died mid-line leaves no newline; start on a fresh line
+        size = os.fstat(fd).st_size
+        if size:
+            os.lseek(fd, size - 1, os.SEEK_SET)
+            if os.read(fd, 1) != b"\n":
+                data = b"\n" + data
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+def _write_pending(pending: dict[Path, list[bytes]], lock: threading.RLock):
+    with lock:
+        batch = dict(pending)
+        pending.clear()
+    for path, lines in batch.items():
+        _append(path, lines)
+
+
+class DiskCache:
+    """Syllable boundaries of lowercased words, persisted per rule in a directory.
+
+    The file of a rule is read into memory the first time the rule is used (or by
+    `warm`), and words syllabified afterwards are appended to it. Entries are kept
+    per file, so rule objects with the same content (e.g. from reloading a rule
+    set) share them.
+    """
+
+    # Entries kept per rule; words beyond it are syllabified but not recorded
+    MAX_ENTRIES = 1_000_000
+    # Longest word recorded; longer ones (e.g. base64 blobs) are not worth keeping
+    MAX_WORD_LENGTH = 64
+    # Seconds after which a file of another rule is considered abandoned
+    STALE_AFTER = 30 * 24 * 3600
+
+    def __init__(self, cache_dir: Union[str, os.PathLike], flush_every: int = 256):
+        """
+        Args:
+            cache_dir: Directory holding the cache files, created if missing
+            flush_every: Number of new entries buffered before they are appended
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.flush_every = flush_every
+        self._entries: dict[Path, dict[str, list[int]]] = {}
+        self._paths: weakref.WeakKeyDictionary[LanguageRule, Path] = weakref.WeakKeyDictionary()
+        self._pending: dict[Path, list[bytes]] = {}
+        self._unflushed = 0
+        self._lock = threading.RLock()
+        # Write what is still buffered when the cache is collected or the interpreter exits
+        weakref.finalize(self, _write_pending, self._pending, self._lock)
+
+    def path(self, rule: LanguageRule) -> Path:
+        """File holding the entries of the rule."""
+        path = self._paths.get(rule)
+        if path is None:
+            path = self.cache_dir / f"{rule_fingerprint(rule)}.tsv"
+            self._paths[rule] = path
+        return path
+
+    def _load(self, rule: LanguageRule) -> dict[str, list[int]]:
+        path = self.path(rule)
+        with self._lock:
+            entries = self._entries.get(path)
+            if entries is not None:
+                return entries
+
+            try:
+                with open(path, "rb") as f:
+                    if fcntl is not None:
+                        fcntl.flock(f.fileno(), fcntl.LOCK_SH)
+                    data = f.read()
+            except FileNotFoundError:
+                data = b""
+            try:
+                # Mark the file as in use so other processes do not prune it
+                os.utime(path)
+            except OSError:
+                pass  # missing, owned by another user or on a read-only mount
+
+            entries = {}
+            for line in data.split(b"\n"):
+                entry = _parse_line(line)
+                if entry is not None and len(entry[0]) <= self.MAX_WORD_LENGTH:
+                    entries[entry[0]] = entry[1]
+                    # Concurrent writers can push a file past the limit
+                    if len(entries) >= self.MAX_ENTRIES:
+                        break
+            self._entries[path] = entries
+            return entries
+
+    def warm(self, rules: Iterable[LanguageRule]):
+        """Load the entries of the rules up front and prune abandoned files."""
+        for rule in rules:
+            self._load(rule)
+        self.prune()
+
+    def prune(self):
+        """Remove files of other rules that were not loaded or extended within STALE_AFTER."""
+        with self._lock:
+            in_use = set(self._entries)
+        cutoff = time.time() - self.STALE_AFTER
+        for path in self.cache_dir.glob("*.tsv"):
+            try:
+                if path not in in_use and path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except FileNotFoundError:
+                pass  # pruned by another process
+
+    def get(self, word_lower: str, rule: LanguageRule) -> Optional[list[int]]:
+        """Cached boundary offsets of a lowercased word, or None."""
+        entries = self._entries.get(self.path(rule))
+        if entries is None:
+            entries = self._load(rule)
+        return entries.get(word_lower)
+
+    def put(self, word_lower: str, rule: LanguageRule, offsets: list[int]):
+        """Record the boundary offsets of a lowercased word."""
+        if len(word_lower) > self.MAX_WORD_LENGTH:
+            return
+        entries = self._entries.get(self.path(rule))
+        if entries is None:
+            entries = self._load(rule)
+
+        with self._lock:
+            if word_lower in entries or len(entries) >= self.MAX_ENTRIES:
+                return
+            entries[word_lower] = offsets
+            self._pending.setdefault(self.path(rule), []).append(_format_line(word_lower, offsets))
+            self._unflushed += 1
+            full = self._unflushed >= self.flush_every
+        if full:
+            self.flush()
+
+    def flush(self):
+        """Append buffered entries to their files."""
+        with self._lock:
+            self._unflushed = 0
+        _write_pending(self._pending, self._lock)
@@ -1,24 +1,132 @@
+from collections import Counter
+from functools import lru_cache
+from typing import Optional
+
+
 class MetaRule:
     """Aggregates information about all language rules and provides cross-language analysis"""
 
-    def __init__(self, rules: list):
+    # Number of distinct texts remembered by find_matches_many between calls,
+    # shared by a meta rule and all meta rules restricted from it
+    BATCH_CACHE_SIZE = 65536
+    # Longest text remembered; the cache is meant for short strings
+    BATCH_MAX_TEXT_LENGTH = 64
+
+    def __init__(self, rules: list, link_rules: bool = True, char_index=None, batch_cache=None):
         self.rules = rules
+        self.link_rules = link_rules
+        if char_index is None:
+            self._build_char_index()
+        else:
+            self._char_index = char_index
         self._calculate_unique_chars()
-        self._link_rules_to_meta()
+        if link_rules:
+            self._link_rules_to_meta()
+        # Keyed by (meta rule, text), so restricted meta rules can share it
+        if batch_cache is None:
+            batch_cache = lru_cache(maxsize=self.BATCH_CACHE_SIZE)(MetaRule._rank)
+        self._rank_cached = batch_cache
+
+    def _build_char_index(self):
+        """Map every known character to the indices of the rules that contain it"""
+        index: dict[str, list[int]] = {}
+        for i, rule in enumerate(self.rules):
+            for char in rule.all_chars:
+                index.setdefault(char, []).append(i)
+        self._char_index = {char: tuple(rule_idxs) for char, rule_idxs in index.items()}
 
     def _calculate_unique_chars(self):
         """Calculate unique characters for each language rule"""
-        for rule in self.rules:
-            rule.unique_chars = rule.all_chars.copy()
-            for other_rule in self.rules:
-                if other_rule.lang != rule.lang:
-                    rule.unique_chars -= other_rule.all_chars
+        self.unique_chars: dict[str, set[str]] = {rule.lang: set() for rule in self.rules}
+        for char, rule_idxs in self._char_index.items():
+            if len(rule_idxs) == 1:
+                self.unique_chars[self.rules[rule_idxs[0]].lang].add(char)
 
     def _link_rules_to_meta(self):
         """Link each rule back to this meta rule"""
         for rule in self.rules:
             rule.meta = self
 
+    def update(self, rules: list):
+        """Add rules, replacing the rules of the same languages in place.
+
+        Only the characters of the added and replaced rules are reindexed, and their
+        uniqueness is recomputed from the index; all other characters keep theirs.
+        """
+        if not isinstance(self._char_index, dict):
+            # A rule table index is read-only
+            self._char_index = dict(self._char_index.items())
+        self.rules = list(self.rules)
+        positions = {rule.lang: i for i, rule in enumerate(self.rules)}
+
+        for rule in rules:
+            i = positions.get(rule.lang)
+            old_chars = self.rules[i].all_chars if i is not None else ()
+            affected = set(old_chars) | set(rule.all_chars)
+            for char in affected:
+                rule_idxs = self._char_index.get(char, ())
+                if len(rule_idxs) == 1:
+                    self.unique_chars[self.rules[rule_idxs[0]].lang].discard(char)
+
+            if i is None:
+                i = len(self.rules)
+                positions[rule.lang] = i
+                self.rules.append(rule)
+                self.unique_chars[rule.lang] = set()
+            else:
+                self.rules[i] = rule
+            if self.link_rules:
+                rule.meta = self
+
+            for char in affected:
+                rule_idxs = tuple(idx for idx in self._char_index.get(char, ()) if idx != i)
+                if char in rule.all_chars:
+                    rule_idxs = tuple(sorted(rule_idxs + (i,)))
+                if rule_idxs:
+                    self._char_index[char] = rule_idxs
+                else:
+                    self._char_index.pop(char, None)
+                if len(rule_idxs) == 1:
+                    self.unique_chars[self.rules[rule_idxs[0]].lang].add(char)
+
+        self._rank_cached.cache_clear()
+
+    def with_rules(self, rules: list) -> "MetaRule":
+        """Copy of this meta rule with rules added or replaced as by update.
+
+        The copy starts from this meta rule's index, so only the characters of the
+        added and replaced rules are reindexed. This meta rule is left unchanged for
+        anyone still using it, e.g. an open DetectionSession.
+        """
+        meta_rule = MetaRule.__new__(MetaRule)
+        meta_rule.rules = list(self.rules)
+        meta_rule.link_rules = self.link_rules
+        meta_rule._char_index = dict(self._char_index.items())
+        meta_rule.unique_chars = {lang: set(chars) for lang, chars in self.unique_chars.items()}
+        meta_rule._rank_cached = lru_cache(maxsize=self.BATCH_CACHE_SIZE)(MetaRule._rank)
+        if meta_rule.link_rules:
+            meta_rule._link_rules_to_meta()
+        meta_rule.update(rules)
+        return meta_rule
+
+    def restrict(self, langs) -> "MetaRule":
+        """Build a meta rule over a subset of languages.
+
+        Unique characters are recomputed within the subset, so a letter shared only
+        with excluded languages counts as unique. The rules stay linked to this meta rule.
+
+        Raises:
+            ValueError: If any of the languages is not supported
+        """
+        by_lang = {rule.lang: rule for rule in self.rules}
+        for lang in langs:
+            if lang not in by_lang:
+                raise ValueError(f"Language '{lang}' is not supported")
+        wanted = set(langs)
+        return MetaRule(
+            [rule for rule in self.rules if rule.lang in wanted], link_rules=False, batch_cache=self._rank_cached
+        )
+
     def get_all_known_chars(self) -> set[str]:
         """Get all characters from all languages"""
         all_chars = set()
@@ -26,35 +134,101 @@ class MetaRule:
             all_chars |= rule.all_chars
         return all_chars
 
-    def find_matches(self, text: str) -> list:
-        """Find all matching languages for the text, sorted by score"""
-        if not text:
-            return []
+    def count_hits(self, text: str, hits: list[int], has_unique: list[bool]) -> int:
+        """Add the text's per-rule character hits to the running counts.
 
-        clean_text = "".join(c.lower() for c in text if c.isalpha())
-        if not clean_text:
+        `hits[i]` grows by the number of letters rule i knows, and `has_unique[i]` is
+        set once a letter unique to rule i is seen. Returns the number of letters.
+        """
+        total = 0
+        for key, count in Counter(c.lower() for c in text if c.isalpha()).items():
+            # lower() may expand one character into several (e.g. "İ")
+            for char in key:
+                total += count
+                rule_idxs = self._char_index.get(char, ())
+                for i in rule_idxs:
+                    hits[i] += count
+                if len(rule_idxs) == 1:
+                    has_unique[rule_idxs[0]] = True
+        return total
+
+    def score_hits(self, hits: list[int], has_unique: list[bool], total: int) -> list[tuple]:
+        """Turn character hits over `total` letters into (rule, score) pairs, best first"""
+        if not total:
             return []
 
-        matches = []
-
-        # Calculate scores for all rules
-        for rule in self.rules:
-            score = rule.calculate_match_score(text)
-            if score > 0:
-                # Boost score if has unique characters
-                if rule.unique_chars and any(c in rule.unique_chars for c in clean_text):
-                    score = 1.0  # Maximum score for unique chars
-                matches.append((rule, score))
+        matches = [
+            (rule, 1.0 if has_unique[i] else hits[i] / total) for i, rule in enumerate(self.rules) if hits[i] > 0
+        ]
 
         # Sort by score descending
         matches.sort(key=lambda x: x[1], reverse=True)
 
-        return [rule for rule, score in matches]
+        return matches
+
+    def _rank(self, text: str) -> tuple:
+        """Score all rules against the text in a single pass, sorted by score.
+
+        Equivalent to calling calculate_match_score for every rule: characters are
+        counted once and the counts are spread over the rules through the char index.
+        A character known to exactly one rule is unique to it and boosts it to 1.0.
+        """
+        hits = [0] * len(self.rules)
+        has_unique = [False] * len(self.rules)
+        total = self.count_hits(text, hits, has_unique)
+        return tuple(rule for rule, score in self.score_hits(hits, has_unique, total))
+
+    def has_foreign_chars(self, text: str, rule) -> bool:
+        """Check if the text has letters the rule does not know but another rule does"""
+        foreign = set(text.lower()).difference(rule.all_chars)
+        return any(self._char_index.get(char) for char in foreign if char.isalpha())
+
+    def find_matches(self, text: str) -> list:
+        """Find all matching languages for the text, sorted by score"""
+        if not text:
+            return []
+        return list(self._rank(text))
+
+    def find_matches_many(self, texts) -> list[list]:
+        """Find matching languages for many texts at once, preserving input order.
+
+        Identical texts are scored only once, and results for short texts are kept in
+        a bounded cache so repeated strings across batches are not rescored.
+        """
+        texts = list(texts)
+        ranked = {
+            text: self._rank_cached(self, text) if len(text) <= self.BATCH_MAX_TEXT_LENGTH else self._rank(text)
+            for text in dict.fromkeys(texts)
+        }
+        return [list(ranked[text]) for text in texts]
 
 
 class LanguageRule:
     """Represents syllabification rules for a specific language and script"""
 
+    # Fields holding sets of single characters
+    CHAR_FIELDS = (
+        "vowels",
+        "consonants",
+        "sonorants",
+        "glides",
+        "syllabic_consonants",
+        "modifiers_attach_left",
+        "modifiers_attach_right",
+        "modifiers_separators",
+        "final_semivowels",
+    )
+    # Fields holding sets of strings (clusters, digraphs, sequences, suffixes)
+    STRING_FIELDS = (
+        "clusters_keep_next",
+        "dont_split_digraphs",
+        "digraph_vowels",
+        "clusters_only_after_long",
+        "final_sequences_keep",
+        "suffixes_break_vre",
+        "suffixes_keep_vre",
+    )
+
     lang: str
     vowels: set[str]
     consonants: set[str]
@@ -74,6 +248,7 @@ class LanguageRule:
     suffixes_break_vre: set[str]
     suffixes_keep_vre: set[str]
     _all_chars: set[str]
+    meta: Optional[MetaRule] = None
 
     def __init__(self, data: dict):
         self.lang = data["lang"]
@@ -97,10 +272,38 @@ class LanguageRule:
 
         self._all_chars = self.vowels | self.consonants
 
+    def __getstate__(self):
+        # The meta rule is a back-reference owned by whoever loaded the rule
+        state = self.__dict__.copy()
+        state.pop("meta", None)
+        return state
+
+    @classmethod
+    def from_fields(cls, lang: str, fields: dict, split_hiatus: bool, all_chars) -> "LanguageRule":
+        """Build a rule from ready-made lookup containers without copying them.
+
+        `fields` maps every name in CHAR_FIELDS and STRING_FIELDS to any container
+        supporting `in`, iteration and `len`, e.g. views over a compiled rule table.
+        """
+        rule = cls.__new__(cls)
+        rule.lang = lang
+        for name in cls.CHAR_FIELDS + cls.STRING_FIELDS:
+            setattr(rule, name, fields[name])
+        rule.split_hiatus = split_hiatus
+        rule._all_chars = all_chars
+        return rule
+
     @property
     def all_chars(self) -> set[str]:
         return self._all_chars
 
+    @property
+    def unique_chars(self) -> set[str]:
+        """Characters no other language of the linked meta rule uses"""
+        if self.meta is None:
+            return set()
+        return self.meta.unique_chars[self.lang]
+
     def is_vowel(self, char: str) -> bool:
         return char in self.vowels
 
@@ -0,0 +1,103 @@
+from collections.abc import Callable
+
+
+class LineBreaker:
+    """Greedy line breaking that hyphenates only the words crossing the line end.
+
+    Words that fit on the current line are never syllabified. A word that does not
+    fit is asked for its break points, and the longest prefix that still fits (with
+    the hyphen) stays on the line.
+    """
+
+    def __init__(
+        self,
+        width: float,
+        syllable_boundaries: Callable[[str], list[int]],
+        measure: Callable[[str], float] = len,
+        hyphen: str = "-",
+    ):
+        """
+        Args:
+            width: Maximum line width, in the units of `measure`
+            syllable_boundaries: Returns syllable boundary offsets inside a run of
+                non-whitespace characters, e.g. a word with punctuation
+            measure: Width of a string; character count by default
+            hyphen: String appended to a line that ends inside a word
+
+        Raises:
+            ValueError: If width is not positive
+        """
+        if width <= 0:
+            raise ValueError(f"Line width must be positive, got {width}")
+        self.width = width
+        self.syllable_boundaries = syllable_boundaries
+        self.measure = measure
+        self.hyphen = hyphen
+
+    def _fits(self, line: str) -> bool:
+        return self.measure(line) <= self.width
+
+    def _break_points(self, chunk: str) -> list[int]:
+        """Offsets inside a whitespace-free chunk where it may be broken."""
+        points = self.syllable_boundaries(chunk)
+        # Existing hyphens (self-service) are break points that need no extra hyphen
+        points += [i + 1 for i, char in enumerate(chunk[:-1]) if char == "-"]
+        return sorted(set(points))
+
+    def _piece(self, chunk: str, start: int, end: int) -> str:
+        """Part of the chunk ending at a break point, with the hyphen if one is needed."""
+        piece = chunk[start:end]
+        return piece if piece.endswith("-") else piece + self.hyphen
+
+    def break_paragraph(self, paragraph: str) -> list[str]:
+        """Break a single paragraph; whitespace between words becomes a single space."""
+        lines = []
+        line = ""
+
+        for chunk in paragraph.split():
+            candidate = f"{line} {chunk}" if line else chunk
+            if self._fits(candidate):
+                line = candidate
+                continue
+
+            points = self._break_points(chunk)
+            pos = 0
+            while True:
+                prefix = f"{line} " if line else ""
+                # Longest prefix of the rest that fits on the current line
+                split = next(
+                    (p for p in reversed(points) if p > pos and self._fits(prefix + self._piece(chunk, pos, p))),
+                    None,
+                )
+                if split is None and line:
+                    # Nothing fits next to the existing words: start a new line
+                    lines.append(line)
+                    line = ""
+                    if self._fits(chunk[pos:]):
+                        line = chunk[pos:]
+                        break
+                    continue
+                if split is None:
+                    # Not even the shortest piece fits on an empty line: overflow
+                    split = next((p for p in points if p > pos), None)
+                    if split is None:
+                        line = chunk[pos:]
+                        break
+
+                lines.append(prefix + self._piece(chunk, pos, split))
+                line = ""
+                pos = split
+                if self._fits(chunk[pos:]):
+                    line = chunk[pos:]
+                    break
+
+        if line or not lines:
+            lines.append(line)
+        return lines
+
+    def break_lines(self, text: str) -> list[str]:
+        """Break text into lines, keeping its newlines as paragraph boundaries."""
+        lines = []
+        for paragraph in text.split("\n"):
+            lines.extend(self.break_paragraph(paragraph))
+        return lines
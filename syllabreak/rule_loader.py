@@ -0,0 +1,99 @@
+"""Loading and compiling rule sets, shared by the bundled and runtime-loaded rules.
+
+A rule set is a mapping in the format of data/rules.yaml (`{"rules": [...]}`),
+given as a dict or as the path of a YAML file. Every rule is compiled into the
+lookup containers of a LanguageRule once per distinct content: compiled rules
+are cached by a hash of their data, and parsed files by a hash of their bytes.
+Instances built from a cached rule share its containers, frozen so no instance
+can change another's rules, but not its meta rule link, so any number of
+Syllabreak instances can load the same rules cheaply.
+"""
+
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Union
+
+import yaml
+
+from .language_rule import LanguageRule
+
+RULE_FIELDS = frozenset(("lang", "split_hiatus") + LanguageRule.CHAR_FIELDS + LanguageRule.STRING_FIELDS)
+REQUIRED_FIELDS = ("vowels", "consonants", "sonorants")
+
+# Number of distinct compiled rules and parsed files kept
+CACHE_SIZE = 256
+
+_compiled_rules: OrderedDict = OrderedDict()
+_parsed_files: OrderedDict = OrderedDict()
+
+
+def _remember(cache: OrderedDict, key: str, value):
+    cache[key] = value
+    if len(cache) > CACHE_SIZE:
+        cache.popitem(last=False)
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def read_rule_data(source: Union[str, os.PathLike, dict]) -> list[dict]:
+    """Rule entries of a rule set given as a dict or a YAML file path.
+
+    Raises:
+        ValueError: If the rule set is malformed
+    """
+    if isinstance(source, dict):
+        data = source
+    else:
+        raw = Path(source).read_bytes()
+        key = _digest(raw)
+        data = _parsed_files.get(key)
+        if data is None:
+            data = yaml.safe_load(raw)
+            _remember(_parsed_files, key, data)
+
+    if not isinstance(data, dict) or not isinstance(data.get("rules"), list):
+        raise ValueError("Rule set must be a mapping with a 'rules' list")
+    for entry in data["rules"]:
+        if not isinstance(entry, dict) or "lang" not in entry:
+            raise ValueError("Every rule must be a mapping with a 'lang'")
+        unknown = set(entry) - RULE_FIELDS
+        if unknown:
+            raise ValueError(f"Rule '{entry['lang']}' has unknown field '{sorted(unknown)[0]}'")
+    return data["rules"]
+
+
+def rule_data(rule: LanguageRule) -> dict:
+    """Data of a compiled rule, in the format it is loaded from."""
+    data = {name: sorted(getattr(rule, name)) for name in LanguageRule.CHAR_FIELDS + LanguageRule.STRING_FIELDS}
+    data["lang"] = rule.lang
+    data["split_hiatus"] = bool(rule.split_hiatus)
+    return data
+
+
+def compile_rule(data: dict) -> LanguageRule:
+    """Build a rule from its data, compiling it only the first time the content is seen.
+
+    Raises:
+        ValueError: If a required field is missing
+    """
+    for name in REQUIRED_FIELDS:
+        if name not in data:
+            raise ValueError(f"Rule '{data['lang']}' is missing '{name}'")
+
+    key = _digest(json.dumps(data, sort_keys=True, default=sorted).encode("utf-8"))
+    compiled = _compiled_rules.get(key)
+    if compiled is None:
+        rule = LanguageRule(data)
+        fields = {
+            name: frozenset(getattr(rule, name)) for name in LanguageRule.CHAR_FIELDS + LanguageRule.STRING_FIELDS
+        }
+        compiled = (rule.lang, fields, rule.split_hiatus, frozenset(rule.all_chars))
+        _remember(_compiled_rules, key, compiled)
+    else:
+        _compiled_rules.move_to_end(key)
+    return LanguageRule.from_fields(*compiled)
@@ -0,0 +1,233 @@
+"""Compiled, read-only rule tables for sharing between processes.
+
+All lookup data of a rule set is packed into one flat buffer. A `RuleTable`
+attached to an mmap'd file exposes the rule fields as views that read the
+buffer in place, so pre-fork workers share the same physical pages instead of
+each holding (and refcount-touching) its own Python sets.
+
+Layout (little-endian, offsets from the start of the buffer):
+
+    header      MAGIC, n_rules, mask_base, mask_count, mask_offset
+    directory   one RULE_RECORD per rule
+    classes     per rule, one u16 of CLASS_BITS flags per codepoint in its range
+    masks       one u64 per codepoint: bit i set if rule i knows the character
+    strings     lang names and NUL-framed string sets
+"""
+
+import mmap
+import os
+import struct
+from collections.abc import Set
+from pathlib import Path
+from typing import Union
+
+from .language_rule import LanguageRule
+
+MAGIC = b"SYLBTAB1"
+HEADER = struct.Struct("<8sIIII")
+# lang (offset, length), class table (base, count, offset), split_hiatus,
+# then (offset, length) for each of LanguageRule.STRING_FIELDS
+RULE_RECORD = struct.Struct("<" + "I" * (6 + 2 * len(LanguageRule.STRING_FIELDS)))
+CLASS_BITS = {name: 1 << i for i, name in enumerate(LanguageRule.CHAR_FIELDS)}
+ALL_CHARS_BITS = CLASS_BITS["vowels"] | CLASS_BITS["consonants"]
+MAX_RULES = 64
+
+
+def _align(data: bytearray, alignment: int):
+    data.extend(b"\0" * (-len(data) % alignment))
+
+
+def compile_rule_table(rules: list[LanguageRule]) -> bytes:
+    """Pack the rules into a flat buffer readable by RuleTable.
+
+    Raises:
+        ValueError: If there are more rules than fit the language mask
+    """
+    if len(rules) > MAX_RULES:
+        raise ValueError(f"Rule table holds at most {MAX_RULES} rules, got {len(rules)}")
+
+    directory_offset = HEADER.size
+    data = bytearray(directory_offset + RULE_RECORD.size * len(rules))
+    records = []
+
+    for rule in rules:
+        chars = set()
+        for name in LanguageRule.CHAR_FIELDS:
+            chars |= set(getattr(rule, name))
+        codepoints = [ord(char) for char in chars]
+        base = min(codepoints, default=0)
+        count = max(codepoints) - base + 1 if codepoints else 0
+        flags = [0] * count
+        for name in LanguageRule.CHAR_FIELDS:
+            for char in getattr(rule, name):
+                flags[ord(char) - base] |= CLASS_BITS[name]
+        _align(data, 2)
+        class_offset = len(data)
+        data += struct.pack(f"<{count}H", *flags)
+        records.append([base, count, class_offset, int(bool(rule.split_hiatus))])
+
+    known = {}
+    for i, rule in enumerate(rules):
+        for char in rule.all_chars:
+            known[ord(char)] = known.get(ord(char), 0) | (1 << i)
+    mask_base = min(known, default=0)
+    mask_count = max(known) - mask_base + 1 if known else 0
+    masks = [known.get(mask_base + i, 0) for i in range(mask_count)]
+    _align(data, 8)
+    mask_offset = len(data)
+    data += struct.pack(f"<{mask_count}Q", *masks)
+
+    for rule, record in zip(rules, records):  # noqa: B905 - strict= needs Python 3.10
+        strings = [rule.lang.encode()]
+        for name in LanguageRule.STRING_FIELDS:
+            entries = sorted(s.encode() for s in getattr(rule, name))
+            strings.append(b"\0" + b"".join(entry + b"\0" for entry in entries))
+        spans = []
+        for blob in strings:
+            spans += [len(data), len(blob)]
+            data += blob
+        record[:0] = spans[:2]
+        record += spans[2:]
+
+    HEADER.pack_into(data, 0, MAGIC, len(rules), mask_base, mask_count, mask_offset)
+    for i, record in enumerate(records):
+        RULE_RECORD.pack_into(data, directory_offset + i * RULE_RECORD.size, *record)
+    return bytes(data)
+
+
+def write_rule_table(path: Union[str, Path], rules: list[LanguageRule]) -> Path:
+    """Compile the rules into a table file, replacing it atomically."""
+    path = Path(path)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(compile_rule_table(rules))
+    os.replace(tmp_path, path)
+    return path
+
+
+class CharSetView(Set):
+    """Read-only set of single characters backed by a rule's class table."""
+
+    def __init__(self, classes: memoryview, base: int, bits: int):
+        self._classes = classes
+        self._base = base
+        self._bits = bits
+        self._len = None
+
+    @classmethod
+    def _from_iterable(cls, it):
+        return set(it)
+
+    def __contains__(self, char) -> bool:
+        if not isinstance(char, str) or len(char) != 1:
+            return False
+        i = ord(char) - self._base
+        return 0 <= i < len(self._classes) and bool(self._classes[i] & self._bits)
+
+    def __iter__(self):
+        for i, flags in enumerate(self._classes):
+            if flags & self._bits:
+                yield chr(self._base + i)
+
+    def __len__(self) -> int:
+        if self._len is None:
+            self._len = sum(1 for _ in self)
+        return self._len
+
+
+class StringSetView(Set):
+    """Read-only set of strings stored as a NUL-framed blob in the table buffer."""
+
+    def __init__(self, buffer, start: int, end: int):
+        self._buffer = buffer
+        self._start = start
+        self._end = end
+
+    @classmethod
+    def _from_iterable(cls, it):
+        return set(it)
+
+    def __contains__(self, value) -> bool:
+        if not isinstance(value, str) or not value:
+            return False
+        return self._buffer.find(b"\0" + value.encode() + b"\0", self._start, self._end) != -1
+
+    def __iter__(self):
+        blob = self._buffer[self._start : self._end]
+        return iter([s.decode() for s in blob.split(b"\0") if s])
+
+    def __len__(self) -> int:
+        return max(self._buffer[self._start : self._end].count(b"\0") - 1, 0)
+
+
+class CharIndexView:
+    """Maps a character to the indices of the rules that know it, as MetaRule expects."""
+
+    def __init__(self, masks: memoryview, base: int):
+        self._masks = masks
+        self._base = base
+        self._rule_idxs: dict[int, tuple] = {}
+
+    def _mask_to_rule_idxs(self, mask: int) -> tuple:
+        rule_idxs = self._rule_idxs.get(mask)
+        if rule_idxs is None:
+            rule_idxs = tuple(i for i in range(mask.bit_length()) if mask >> i & 1)
+            self._rule_idxs[mask] = rule_idxs
+        return rule_idxs
+
+    def get(self, char: str, default=None):
+        i = ord(char) - self._base if len(char) == 1 else -1
+        if not 0 <= i < len(self._masks) or not self._masks[i]:
+            return default
+        return self._mask_to_rule_idxs(self._masks[i])
+
+    def items(self):
+        for i, mask in enumerate(self._masks):
+            if mask:
+                yield chr(self._base + i), self._mask_to_rule_idxs(mask)
+
+
+class RuleTable:
+    """Language rules attached to a compiled table buffer without copying it.
+
+    The buffer must support `find` (bytes or mmap). Use RuleTable.open to map a file
+    written by write_rule_table; a file on /dev/shm behaves like shared memory.
+    Lookups through the views are slower than through Python sets, in exchange for
+    memory that stays shared between forked workers.
+    """
+
+    def __init__(self, buffer):
+        self._buffer = buffer
+        self._view = memoryview(buffer)
+        magic, n_rules, mask_base, mask_count, mask_offset = HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise ValueError("Not a syllabreak rule table")
+
+        self.char_index = CharIndexView(self._view[mask_offset : mask_offset + 8 * mask_count].cast("Q"), mask_base)
+        self._records = [self._read_record(HEADER.size + i * RULE_RECORD.size) for i in range(n_rules)]
+
+    @classmethod
+    def open(cls, path: Union[str, Path]) -> "RuleTable":
+        """Map a table file read-only."""
+        with open(path, "rb") as f:
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def _read_record(self, offset: int) -> tuple:
+        """Arguments of LanguageRule.from_fields for the rule record at the offset."""
+        lang_offset, lang_len, base, count, class_offset, split_hiatus, *spans = RULE_RECORD.unpack_from(
+            self._buffer, offset
+        )
+        classes = self._view[class_offset : class_offset + 2 * count].cast("H")
+        fields = {name: CharSetView(classes, base, bits) for name, bits in CLASS_BITS.items()}
+        for i, name in enumerate(LanguageRule.STRING_FIELDS):
+            start, length = spans[2 * i], spans[2 * i + 1]
+            fields[name] = StringSetView(self._buffer, start, start + length)
+        lang = bytes(self._view[lang_offset : lang_offset + lang_len]).decode()
+        return lang, fields, bool(split_hiatus), CharSetView(classes, base, ALL_CHARS_BITS)
+
+    def rules(self) -> list[LanguageRule]:
+        """Rules in table order, matching the indices used by char_index.
+
+        Every call returns new rule objects over the same views, so each Syllabreak
+        attached to the table links its own rules to its own meta rule.
+        """
+        return [LanguageRule.from_fields(*record) for record in self._records]
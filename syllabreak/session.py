@@ -0,0 +1,106 @@
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Optional
+
+from .language_rule import LanguageRule
+
+if TYPE_CHECKING:
+    from .syllabreak import Syllabreak
+
+
+class DetectionSession:
+    """Detects the language of a document once and reuses it for every call.
+
+    Character hits are accumulated across calls until one language leads with a
+    score of at least `threshold` over at least `min_chars` letters, and no other
+    language scores as high. From then on that language is locked in, and a text
+    is only looked at again if it has letters the locked language does not know.
+    Such a text is detected on its own, and if another language wins, the session
+    starts over with that text as its only evidence.
+    """
+
+    def __init__(
+        self,
+        syllabreak: "Syllabreak",
+        threshold: float = 0.95,
+        min_chars: int = 40,
+        candidates: Optional[Iterable[str]] = None,
+    ):
+        self.syllabreak = syllabreak
+        self.threshold = threshold
+        self.min_chars = min_chars
+        self.meta_rule = syllabreak._get_meta_rule(candidates)
+        self.locked_rule: Optional[LanguageRule] = None
+        self._reset()
+
+    def __enter__(self) -> "DetectionSession":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._reset()
+        self.locked_rule = None
+
+    def _reset(self):
+        self._hits = [0] * len(self.meta_rule.rules)
+        self._has_unique = [False] * len(self.meta_rule.rules)
+        self._total = 0
+
+    @property
+    def lang(self) -> Optional[str]:
+        """Language locked in for the document, if any."""
+        return self.locked_rule.lang if self.locked_rule else None
+
+    def _matches(self, text: str) -> list[tuple]:
+        """Scored matches for the text, taking the evidence of earlier calls into account."""
+        if not any(char.isalpha() for char in text):
+            # No letters, no evidence: nothing matches, as in Syllabreak.detect_language
+            return []
+
+        if self.locked_rule is not None:
+            if not self.meta_rule.has_foreign_chars(text, self.locked_rule):
+                return [(self.locked_rule, 1.0)]
+
+            # Conflicting letters: look at this text alone
+            hits = [0] * len(self.meta_rule.rules)
+            has_unique = [False] * len(self.meta_rule.rules)
+            total = self.meta_rule.count_hits(text, hits, has_unique)
+            matches = self.meta_rule.score_hits(hits, has_unique, total)
+            if not matches or matches[0][0] is self.locked_rule:
+                return matches
+            # The document switched language: start over from this text
+            self.locked_rule = None
+            self._hits, self._has_unique, self._total = hits, has_unique, total
+            self._try_lock(matches)
+            return matches
+
+        self._total += self.meta_rule.count_hits(text, self._hits, self._has_unique)
+        matches = self.meta_rule.score_hits(self._hits, self._has_unique, self._total)
+        self._try_lock(matches)
+        return matches
+
+    def _try_lock(self, matches: list[tuple]):
+        if self._total < self.min_chars or not matches:
+            return
+        rule, score = matches[0]
+        decisive = len(matches) == 1 or matches[1][1] < score
+        if score >= self.threshold and decisive:
+            self.locked_rule = rule
+
+    def detect_language(self, text: str) -> list[str]:
+        """Detect languages of the text in the context of the document, most likely first."""
+        return [rule.lang for rule, score in self._matches(text)]
+
+    def syllabify(self, text: str, timeout: Optional[float] = None) -> str:
+        """Syllabify text with the document's language.
+
+        Args:
+            text: Text to syllabify
+            timeout: Optional time budget in seconds, as in Syllabreak.syllabify
+        """
+        if not text:
+            return text
+
+        matches = self._matches(text)
+        if not matches:
+            return text
+
+        return self.syllabreak.syllabify(text, lang=matches[0][0].lang, timeout=timeout)
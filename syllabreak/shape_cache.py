@@ -0,0 +1,123 @@
+"""Cache of syllable boundaries keyed by word shape instead of by word.
+
+Syllabification only ever asks two kinds of questions about a word: which
+character classes (CHAR_FIELDS) a character belongs to, and whether a substring
+is one of the rule's strings (clusters, digraphs, protected sequences,
+suffixes). A word's shape keeps exactly the information needed to answer them:
+
+- Every occurrence of a rule string in the word keeps its characters.
+- Every other character is replaced by a placeholder for its character class.
+
+Two words with the same shape get the same answers to every question the
+syllabifier asks, so they get the same boundaries. This needs every rule-string
+check to look at adjacent characters, which holds only when the word contains no
+modifiers, separators or unknown characters (the syllabifier skips those when it
+pairs consonants or vowels). Such words get a coarser shape instead: only
+characters that appear in no rule string at all are replaced.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+
+from .language_rule import LanguageRule
+
+# Placeholders come from the private use area, whose characters are never letters.
+# It lies in the BMP, so keys of BMP words take two bytes per character.
+PLACEHOLDER_BASE = 0xE000
+
+
+class WordShape:
+    """Computes shape keys for words of one language rule."""
+
+    def __init__(self, rule: LanguageRule):
+        self.rule = rule
+        self.strings = sorted(set().union(*(getattr(rule, name) for name in LanguageRule.STRING_FIELDS)))
+        in_strings = set("".join(self.strings))
+
+        alphabet = set().union(*(getattr(rule, name) for name in LanguageRule.CHAR_FIELDS))
+        profiles: dict[tuple, str] = {}
+        placeholders = {}
+        for char in sorted(alphabet):
+            profile = tuple(char in getattr(rule, name) for name in LanguageRule.CHAR_FIELDS)
+            placeholders[char] = profiles.setdefault(profile, chr(PLACEHOLDER_BASE + len(profiles)))
+
+        # Characters safe to compare only through adjacent substrings
+        modifiers = rule.modifiers_attach_left | rule.modifiers_attach_right | rule.modifiers_separators
+        self.plain_chars = frozenset(
+            char for char in rule.vowels | rule.consonants | rule.glides | rule.sonorants if char not in modifiers
+        )
+        self.contextual_table = str.maketrans(placeholders)
+        self.global_table = str.maketrans(
+            {char: placeholder for char, placeholder in placeholders.items() if char not in in_strings}
+        )
+
+    def key(self, word_lower: str) -> tuple:
+        """Shape key of a lowercased word."""
+        if not self.plain_chars.issuperset(word_lower):
+            return (False, word_lower.translate(self.global_table))
+
+        shape = list(word_lower.translate(self.contextual_table))
+        for string in self.strings:
+            start = word_lower.find(string)
+            while start != -1:
+                shape[start : start + len(string)] = string
+                start = word_lower.find(string, start + 1)
+        return (True, "".join(shape))
+
+
+class ShapeCache:
+    """Bounded LRU cache of syllable boundary offsets keyed by word shape.
+
+    Safe to share between threads; words are syllabified outside the lock.
+    Keys are as long as their words, so longer words are not cached at all. A
+    miss costs the shape key on top of syllabification, so the cache only pays
+    off on text that repeats word shapes.
+    """
+
+    # Longest word that is cached; keeps the memory of a full cache bounded
+    MAX_WORD_LENGTH = 32
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._shapes: dict[LanguageRule, WordShape] = {}
+        self._lock = threading.Lock()
+
+    def _shape(self, rule: LanguageRule) -> WordShape:
+        shape = self._shapes.get(rule)
+        if shape is None:
+            shape = self._shapes.setdefault(rule, WordShape(rule))
+        return shape
+
+    def get(self, word: str, rule: LanguageRule, compute: Callable[[str, LanguageRule], list[int]]) -> list[int]:
+        """Boundary offsets of the word, computed only for the first word of each shape."""
+        lower = word.lower()
+        # lower() can change the length (e.g. "İ"), so offsets would not carry over
+        if len(lower) != len(word) or len(word) > self.MAX_WORD_LENGTH:
+            return compute(word, rule)
+
+        key = (rule, self._shape(rule).key(lower))
+        with self._lock:
+            offsets = self._entries.get(key)
+            if offsets is not None:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return offsets
+            self.misses += 1
+
+        offsets = compute(word, rule)
+        with self._lock:
+            self._entries[key] = offsets
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return offsets
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._shapes.clear()
+            self.hits = 0
+            self.misses = 0
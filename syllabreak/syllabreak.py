@@ -1,31 +1,193 @@
+import functools
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
-
-import yaml
+from typing import Optional, Union
 
+from .disk_cache import DiskCache
 from .language_rule import LanguageRule, MetaRule
-from .word_syllabifier import WordSyllabifier
+from .line_breaker import LineBreaker
+from .rule_loader import compile_rule, read_rule_data, rule_data
+from .rule_table import RuleTable
+from .session import DetectionSession
+from .shape_cache import ShapeCache
+from .word_syllabifier import WordSyllabifier, insert_hyphens
+
+
+@dataclass
+class WordSyllables:
+    """A word of a text and its syllables, as offsets into the text."""
+
+    start: int
+    end: int
+    # Language the whole text is syllabified with (given or detected), so every
+    # word of a text has the same one; None when no language matches the text
+    lang: Optional[str]
+    # (start, end) of every syllable; a word that is not split has one
+    syllables: list[tuple[int, int]]
 
 
 class Syllabreak:
-    def __init__(self, soft_hyphen: str = "\u00ad"):
+    # Words per task when syllabify_corpus runs on an executor
+    CORPUS_CHUNK_SIZE = 2048
+    # Number of candidate sets whose restricted meta rules are kept
+    CANDIDATE_CACHE_SIZE = 32
+
+    def __init__(
+        self,
+        soft_hyphen: str = "\u00ad",
+        languages: Optional[Iterable[str]] = None,
+        rule_table: Optional[RuleTable] = None,
+        max_word_length: Optional[int] = None,
+        shape_cache_size: int = 0,
+        cache_dir: Optional[Union[str, os.PathLike]] = None,
+    ):
+        """
+        Syllabification runs in time linear in the length of each word, so the cost of
+        a call is linear in the length of the text.
+
+        Args:
+            soft_hyphen: String inserted at syllable boundaries
+            languages: Optional language codes to load. Other languages are neither
+                detected nor accepted as `lang`.
+            rule_table: Optional compiled rule table to read rules from instead of the
+                bundled rules.yaml, e.g. one mapped before forking worker processes
+            max_word_length: Optional limit on word length; longer words (e.g. base64
+                blobs in untrusted input) are passed through unchanged
+            shape_cache_size: Number of word shapes whose boundaries are cached; words
+                of a known shape reuse them without being syllabified. Disabled (0) by
+                default, since new words cost more with it; enable it for text that
+                repeats word shapes.
+            cache_dir: Optional directory for a persistent cache of syllabified words,
+                loaded at construction so restarted processes start warm. Entries are
+                tied to the content of each rule, and processes may share the directory.
+
+        Raises:
+            ValueError: If any of the languages is not supported
+        """
         self.soft_hyphen = soft_hyphen
-        self.meta_rule = self._load_rules()
+        self.max_word_length = max_word_length
+        self.shape_cache = ShapeCache(shape_cache_size) if shape_cache_size > 0 else None
+        self.meta_rule = self._load_rules(languages, rule_table)
+        self._candidate_meta_rules: OrderedDict[frozenset, MetaRule] = OrderedDict()
+        self.disk_cache = DiskCache(cache_dir) if cache_dir is not None else None
+        if self.disk_cache is not None:
+            self.disk_cache.warm(self.meta_rule.rules)
 
-    def _load_rules(self) -> MetaRule:
-        rules_file = Path(__file__).parent / "data" / "rules.yaml"
-        with open(rules_file, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
-        rules = [LanguageRule(rule_data) for rule_data in data["rules"]]
+    def _load_rules(
+        self, languages: Optional[Iterable[str]] = None, rule_table: Optional[RuleTable] = None
+    ) -> MetaRule:
+        if rule_table is not None:
+            rules = rule_table.rules()
+            if languages is None:
+                return MetaRule(rules, char_index=rule_table.char_index)
+        else:
+            rules_file = Path(__file__).parent / "data" / "rules.yaml"
+            rules = [compile_rule(data) for data in read_rule_data(rules_file)]
+
+        if languages is not None:
+            wanted = set(languages)
+            unknown = wanted - {rule.lang for rule in rules}
+            if unknown:
+                raise ValueError(f"Language '{sorted(unknown)[0]}' is not supported")
+            rules = [rule for rule in rules if rule.lang in wanted]
         return MetaRule(rules)
 
-    def detect_language(self, text: str) -> list[str]:
-        matching_rules = self.meta_rule.find_matches(text)
+    def load_rules(self, source: Union[str, os.PathLike, dict]):
+        """Add languages or override loaded ones at runtime.
+
+        `source` is a rule set in the format of the bundled rules.yaml, either a dict
+        or the path of a YAML file. A rule for a language that is already loaded only
+        needs the fields it changes; the others are taken from the loaded rule. Rules
+        are compiled once per distinct content, so switching between rule sets is cheap.
+
+        Args:
+            source: Rule set dict or path of a YAML rule file
+
+        Raises:
+            ValueError: If the rule set is malformed or a new language misses a required field
+        """
+        loaded = {rule.lang: rule for rule in self.meta_rule.rules}
+        rules = []
+        for entry in read_rule_data(source):
+            base = loaded.get(entry["lang"])
+            rules.append(compile_rule({**rule_data(base), **entry} if base else entry))
+
+        # Open sessions keep the meta rule they started with
+        self.meta_rule = self.meta_rule.with_rules(rules)
+        self._candidate_meta_rules.clear()
+        if self.shape_cache is not None:
+            self.shape_cache.clear()
+        if self.disk_cache is not None:
+            self.disk_cache.warm(rules)
+
+    def _get_meta_rule(self, candidates: Optional[Iterable[str]] = None) -> MetaRule:
+        """Get the meta rule restricted to the candidate languages, building it on first use."""
+        if candidates is None:
+            return self.meta_rule
+        # A single language code, not an iterable of its letters
+        key = frozenset([candidates] if isinstance(candidates, str) else candidates)
+        meta_rule = self._candidate_meta_rules.get(key)
+        if meta_rule is not None:
+            self._candidate_meta_rules.move_to_end(key)
+            return meta_rule
+
+        meta_rule = self.meta_rule.restrict(key)
+        self._candidate_meta_rules[key] = meta_rule
+        if len(self._candidate_meta_rules) > self.CANDIDATE_CACHE_SIZE:
+            self._candidate_meta_rules.popitem(last=False)
+        return meta_rule
+
+    def detect_language(self, text: str, candidates: Optional[Iterable[str]] = None) -> list[str]:
+        """Detect languages of the text, most likely first.
+
+        Args:
+            text: Text to analyze
+            candidates: Optional language codes to choose from. Characters are treated
+                as unique when no other candidate uses them.
+
+        Raises:
+            ValueError: If any candidate language is not supported
+        """
+        matching_rules = self._get_meta_rule(candidates).find_matches(text)
         return [rule.lang for rule in matching_rules]
 
-    def _auto_detect_rule(self, text: str) -> Optional[LanguageRule]:
+    def detect_language_many(self, texts: Iterable[str], candidates: Optional[Iterable[str]] = None) -> list[list[str]]:
+        """Detect languages for a batch of texts.
+
+        Returns one ranked language list per input text, in input order. Equivalent to
+        calling detect_language on each text, but identical texts are scored once and
+        cached across calls, which pays off on large batches of short strings.
+        """
+        meta_rule = self._get_meta_rule(candidates)
+        return [[rule.lang for rule in rules] for rules in meta_rule.find_matches_many(texts)]
+
+    def session(
+        self, threshold: float = 0.95, min_chars: int = 40, candidates: Optional[Iterable[str]] = None
+    ) -> DetectionSession:
+        """Start a session for syllabifying one document in several calls.
+
+        The session accumulates language evidence across calls and locks in a
+        language once it is confident, so later calls skip detection:
+
+            with syllabreak.session() as s:
+                for paragraph in paragraphs:
+                    s.syllabify(paragraph)
+
+        Args:
+            threshold: Score the leading language needs to be locked in
+            min_chars: Number of letters seen before a language can be locked in
+            candidates: Optional language codes detection chooses from
+        """
+        return DetectionSession(self, threshold, min_chars, candidates)
+
+    def _auto_detect_rule(self, text: str, candidates: Optional[Iterable[str]] = None) -> Optional[LanguageRule]:
         """Auto-detect the first matching language rule for the text."""
-        matching_rules = self.meta_rule.find_matches(text)
+        matching_rules = self._get_meta_rule(candidates).find_matches(text)
         return matching_rules[0] if matching_rules else None
 
     def _get_rule_by_lang(self, lang: str) -> LanguageRule:
@@ -35,12 +197,22 @@ class Syllabreak:
                 return rule
         raise ValueError(f"Language '{lang}' is not supported")
 
-    def syllabify(self, text: str, lang: Optional[str] = None) -> str:
+    def syllabify(
+        self,
+        text: str,
+        lang: Optional[str] = None,
+        candidates: Optional[Iterable[str]] = None,
+        timeout: Optional[float] = None,
+    ) -> str:
         """Syllabify text by inserting soft hyphens at syllable boundaries.
 
         Args:
             text: Text to syllabify
             lang: Optional language code (e.g., 'eng', 'srp-latn'). If not provided, auto-detects.
+            candidates: Optional language codes auto-detection chooses from
+            timeout: Optional time budget in seconds. Words reached after it runs out
+                are passed through unchanged; combine with max_word_length to bound
+                the time spent on a single word.
 
         Raises:
             ValueError: If specified language is not supported
@@ -48,30 +220,234 @@ class Syllabreak:
         if not text:
             return text
 
+        rule = self._resolve_rule(text, lang, candidates)
+        if not rule:
+            return text
+
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        return self._syllabify_with_rule(text, rule, deadline=deadline)
+
+    def _resolve_rule(
+        self, text: str, lang: Optional[str], candidates: Optional[Iterable[str]] = None
+    ) -> Optional[LanguageRule]:
+        """Get the rule for an explicit language code, or auto-detect it from the text."""
         if lang:
-            rule = self._get_rule_by_lang(lang)
-        else:
-            rule = self._auto_detect_rule(text)
-            if not rule:
-                return text
+            return self._get_rule_by_lang(lang)
+        return self._auto_detect_rule(text, candidates)
 
-        # Process each word
-        result = []
+    @staticmethod
+    def _iter_word_spans(text: str) -> Iterator[tuple[int, int]]:
+        """Yield (start, end) offsets of every run of letters in the text."""
         i = 0
+        n = len(text)
 
-        while i < len(text):
-            # Find word boundaries
+        while i < n:
             if not text[i].isalpha():
-                result.append(text[i])
                 i += 1
                 continue
 
             # Found start of word
             word_start = i
-            while i < len(text) and text[i].isalpha():
+            while i < n and text[i].isalpha():
                 i += 1
+            yield word_start, i
+
+    def _word_boundaries(self, word: str, rule: LanguageRule) -> list[int]:
+        """Syllable boundary offsets for a single word."""
+        if self.max_word_length is not None and len(word) > self.max_word_length:
+            return []
+        if self.disk_cache is None:
+            return self._memory_boundaries(word, rule)
+
+        lower = word.lower()
+        # lower() can change the length (e.g. "İ"), so offsets would not carry over
+        if len(lower) != len(word):
+            return self._memory_boundaries(word, rule)
+        offsets = self.disk_cache.get(lower, rule)
+        if offsets is None:
+            offsets = self._memory_boundaries(word, rule)
+            self.disk_cache.put(lower, rule, offsets)
+        return offsets
 
-            word = text[word_start:i]
-            result.append(WordSyllabifier(word, rule, self.soft_hyphen).syllabify())
+    def _memory_boundaries(self, word: str, rule: LanguageRule) -> list[int]:
+        """Syllable boundary offsets for a single word, through the shape cache."""
+        if self.shape_cache is None:
+            return self._syllabify_word(word, rule)
+        return self.shape_cache.get(word, rule, self._syllabify_word)
+
+    def _syllabify_word(self, word: str, rule: LanguageRule) -> list[int]:
+        """Run the syllabifier on a single word."""
+        return WordSyllabifier(word, rule, self.soft_hyphen).boundary_offsets()
+
+    def _chunk_boundaries(self, chunk: str, rule: Optional[LanguageRule]) -> list[int]:
+        """Syllable boundary offsets of every word inside the chunk."""
+        if rule is None:
+            return []
+        return [
+            start + offset
+            for start, end in self._iter_word_spans(chunk)
+            for offset in self._word_boundaries(chunk[start:end], rule)
+        ]
+
+    def break_lines(
+        self,
+        text: str,
+        width: float,
+        measure: Callable[[str], float] = len,
+        lang: Optional[str] = None,
+        candidates: Optional[Iterable[str]] = None,
+        hyphen: str = "-",
+    ) -> list[str]:
+        """Break text into lines no wider than `width`, hyphenating words that cross a line end.
+
+        Only the words that do not fit at the end of a line are syllabified. Newlines
+        start a new paragraph; other whitespace between words becomes a single space.
+        A word that does not fit even on an empty line overflows it.
+
+        Args:
+            text: Text to break
+            width: Maximum line width, in the units of `measure`
+            measure: Width of a string, e.g. a font metric; character count by default
+            lang: Optional language code (e.g., 'eng', 'srp-latn'). If not provided, auto-detects.
+            candidates: Optional language codes auto-detection chooses from
+            hyphen: String appended to a line that ends inside a word
+
+        Raises:
+            ValueError: If specified language is not supported or width is not positive
+        """
+        rule = self._resolve_rule(text, lang, candidates) if text else None
+        syllable_boundaries = functools.partial(self._chunk_boundaries, rule=rule)
+        return LineBreaker(width, syllable_boundaries, measure, hyphen).break_lines(text)
+
+    def iter_syllables(
+        self, text: str, lang: Optional[str] = None, candidates: Optional[Iterable[str]] = None
+    ) -> Iterator[WordSyllables]:
+        """Iterate over the words of the text with their syllable spans.
+
+        Yields one record per word, in order, without building any strings, so a huge
+        text can be consumed with constant memory. Like syllabify, the whole text is
+        syllabified with one language, which every record carries. Spans are offsets
+        into `text`; joining the text with soft hyphens between syllables gives the
+        output of syllabify.
+
+        Args:
+            text: Text to syllabify
+            lang: Optional language code (e.g., 'eng', 'srp-latn'). If not provided, auto-detects.
+            candidates: Optional language codes auto-detection chooses from
+
+        Raises:
+            ValueError: If specified language is not supported
+        """
+        rule = self._resolve_rule(text, lang, candidates) if text else None
+        return self._iter_word_syllables(text, rule)
+
+    def _iter_word_syllables(self, text: str, rule: Optional[LanguageRule]) -> Iterator[WordSyllables]:
+        for start, end in self._iter_word_spans(text):
+            offsets = self._word_boundaries(text[start:end], rule) if rule else []
+            edges = [start, *(start + offset for offset in offsets), end]
+            syllables = [(edges[i], edges[i + 1]) for i in range(len(edges) - 1)]
+            yield WordSyllables(start, end, rule.lang if rule else None, syllables)
+
+    def _syllabify_with_rule(
+        self, text: str, rule: LanguageRule, known: Optional[dict] = None, deadline: Optional[float] = None
+    ) -> str:
+        """Syllabify every word of the text with the rule.
+
+        `known` maps lowercased words to precomputed boundary offsets; words missing
+        from it are syllabified directly. Once the monotonic clock reaches `deadline`,
+        the rest of the text is kept as is.
+        """
+        result = []
+        prev = 0
+
+        for start, end in self._iter_word_spans(text):
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            result.append(text[prev:start])
+            word = text[start:end]
+            offsets = known.get(word.lower()) if known else None
+            if offsets is None:
+                offsets = self._word_boundaries(word, rule)
+            result.append(insert_hyphens(word, offsets, self.soft_hyphen))
+            prev = end
+        result.append(text[prev:])
 
         return "".join(result)
+
+    def syllabify_corpus(
+        self,
+        documents: Iterable[str],
+        lang: Optional[str] = None,
+        candidates: Optional[Iterable[str]] = None,
+        executor: Optional[Executor] = None,
+    ) -> list[str]:
+        """Syllabify a batch of documents, syllabifying each distinct word only once.
+
+        The first pass collects the (language, lowercased word) vocabulary of the whole
+        batch, the second syllabifies every vocabulary entry once, and the documents are
+        then rebuilt by replaying the boundaries onto the original casing. The output is
+        the same as calling syllabify on each document.
+
+        Args:
+            documents: Texts to syllabify
+            lang: Optional language code for all documents. If not provided, each
+                document is auto-detected separately.
+            candidates: Optional language codes auto-detection chooses from
+            executor: Optional executor to syllabify the vocabulary in parallel. Process
+                pools need picklable rules, so they do not work with a rule table.
+
+        Raises:
+            ValueError: If specified language is not supported
+        """
+        jobs = [(doc, self._resolve_rule(doc, lang, candidates) if doc else None) for doc in documents]
+
+        vocabulary: dict[LanguageRule, dict[str, None]] = {}
+        for doc, rule in jobs:
+            if rule is None:
+                continue
+            words = vocabulary.setdefault(rule, {})
+            for start, end in self._iter_word_spans(doc):
+                word = doc[start:end]
+                lower = word.lower()
+                # lower() can change the length (e.g. "İ"), so offsets would not replay
+                if len(lower) == len(word) and (self.max_word_length is None or len(word) <= self.max_word_length):
+                    words[lower] = None
+
+        known = self._syllabify_vocabulary(vocabulary, executor)
+
+        return [self._syllabify_with_rule(doc, rule, known[rule]) if rule else doc for doc, rule in jobs]
+
+    def _syllabify_vocabulary(
+        self, vocabulary: dict[LanguageRule, dict[str, None]], executor: Optional[Executor]
+    ) -> dict[LanguageRule, dict[str, list[int]]]:
+        """Compute boundary offsets for every word of the vocabulary, per rule."""
+        if executor is None:
+            return {
+                rule: {word: self._word_boundaries(word, rule) for word in words} for rule, words in vocabulary.items()
+            }
+
+        known: dict[LanguageRule, dict[str, list[int]]] = {rule: {} for rule in vocabulary}
+        futures = []
+        for rule, words in vocabulary.items():
+            if self.disk_cache is not None:
+                for word in words:
+                    offsets = self.disk_cache.get(word, rule)
+                    if offsets is not None:
+                        known[rule][word] = offsets
+            words = [word for word in words if word not in known[rule]]
+            for i in range(0, len(words), self.CORPUS_CHUNK_SIZE):
+                chunk = words[i : i + self.CORPUS_CHUNK_SIZE]
+                futures.append((rule, executor.submit(_vocabulary_boundaries, rule, chunk, self.soft_hyphen)))
+
+        for rule, future in futures:
+            boundaries = future.result()
+            known[rule].update(boundaries)
+            if self.disk_cache is not None:
+                for word, offsets in boundaries.items():
+                    self.disk_cache.put(word, rule, offsets)
+        return known
+
+
+def _vocabulary_boundaries(rule: LanguageRule, words: list[str], soft_hyphen: str) -> dict[str, list[int]]:
+    """Boundary offsets for a chunk of words; module-level so process pools can pickle it."""
+    return {word: WordSyllabifier(word, rule, soft_hyphen).boundary_offsets() for word in words}
@@ -32,3 +32,62 @@ def test_detect_language(text, expected):
         )
     else:
         assert result == [], f"Failed for '{text}': got {result}, expected empty list"
+
+
+def test_detect_language_many_matches_single_calls():
+    s = Syllabreak()
+    texts = [text for text, _ in load_test_cases()]
+    texts += texts[:5]  # duplicates must be answered in place
+
+    assert s.detect_language_many(texts) == [s.detect_language(text) for text in texts]
+
+
+def test_detect_language_many_empty_batch():
+    assert Syllabreak().detect_language_many([]) == []
+
+
+def test_detect_language_many_cache_is_shared_and_short():
+    s = Syllabreak()
+    long_text = "hello " * 20
+    s.detect_language_many(["hello", long_text])
+    s.detect_language_many(["lepo"], candidates=["srp-latn", "rus"])
+    cache = s.meta_rule._rank_cached
+    assert s._get_meta_rule(["srp-latn", "rus"])._rank_cached is cache
+    assert cache.cache_info().currsize == 2
+
+
+def test_detect_language_candidates():
+    s = Syllabreak()
+    assert s.detect_language("lepo", candidates=["srp-latn", "rus"]) == ["srp-latn"]
+    assert s.detect_language("привет", candidates=["eng", "tur"]) == []
+    assert s.detect_language("lepo", candidates="srp-latn") == ["srp-latn"]
+
+
+def test_detect_language_candidate_cache_is_bounded():
+    s = Syllabreak()
+    langs = [rule.lang for rule in s.meta_rule.rules]
+    for i in range(len(langs)):
+        for j in range(i + 1, len(langs)):
+            s.detect_language("hello", candidates=[langs[i], langs[j]])
+    assert len(s._candidate_meta_rules) == Syllabreak.CANDIDATE_CACHE_SIZE
+
+
+def test_detect_language_candidates_recompute_unique_chars():
+    s = Syllabreak()
+    # "ö" is shared with German, so it only becomes decisive without it
+    meta_rule = s.meta_rule.restrict(["tur", "eng"])
+    assert "ö" in meta_rule.unique_chars["tur"]
+    assert "ö" not in s.meta_rule.unique_chars["tur"]
+
+
+def test_detect_language_restricted_instance():
+    s = Syllabreak(languages=["srp-latn", "rus"])
+    assert s.detect_language("hello") == ["srp-latn"]
+    assert [rule.lang for rule in s.meta_rule.rules] == ["rus", "srp-latn"]
+
+
+def test_detect_language_unsupported_candidate():
+    with pytest.raises(ValueError):
+        Syllabreak().detect_language("hello", candidates=["xxx"])
+    with pytest.raises(ValueError):
+        Syllabreak(languages=["eng", "xxx"])
@@ -0,0 +1,59 @@
+from syllabreak import Syllabreak
+from syllabreak.differential import generate_words, reference_engine, run_differential, shrink
+from syllabreak.test_syllabreak import load_test_cases
+
+
+def drop_last_boundary(word, rule):
+    """Faulty engine: loses the last boundary of words with three or more."""
+    offsets = reference_engine(word, rule)
+    return offsets[:-1] if len(offsets) >= 3 else offsets
+
+
+def test_reference_agrees_with_itself():
+    corpus = [text for _, _, text, _ in load_test_cases()]
+    report = run_differential(reference_engine, words_per_rule=200, corpus=corpus)
+
+    assert report.ok
+    assert report.words_checked > 200 * len(Syllabreak().meta_rule.rules)
+    assert report.reference_time > 0
+    assert report.engine_time > 0
+
+
+def test_mismatches_are_found_and_shrunk():
+    report = run_differential(drop_last_boundary, words_per_rule=200)
+
+    assert not report.ok
+    for mismatch in report.mismatches:
+        assert len(mismatch.minimal) <= len(mismatch.word)
+        assert mismatch.actual != mismatch.expected
+
+
+def test_shrink_finds_minimal_word():
+    rule = Syllabreak()._get_rule_by_lang("eng")
+    minimal = shrink("collaboration", rule, drop_last_boundary)
+
+    assert len(reference_engine(minimal, rule)) == 3
+    for i in range(len(minimal)):
+        smaller = minimal[:i] + minimal[i + 1 :]
+        assert reference_engine(smaller, rule) == drop_last_boundary(smaller, rule)
+
+
+def test_engine_exceptions_are_mismatches():
+    def crashing(word, rule):
+        raise RuntimeError("boom")
+
+    rule = Syllabreak()._get_rule_by_lang("srp-latn")
+    report = run_differential(crashing, rules=[rule], words_per_rule=5)
+
+    assert len(report.mismatches) > 0
+    assert isinstance(report.mismatches[0].actual, RuntimeError)
+
+
+def test_generated_words_cover_rule_features():
+    rules = {rule.lang: rule for rule in Syllabreak().meta_rule.rules}
+
+    rus = "".join(generate_words(rules["rus"], 300)).lower()
+    assert "ь" in rus and "ъ" in rus
+    eng = generate_words(rules["eng"], 300)
+    assert any(word.lower().endswith(seq) for word in eng for seq in rules["eng"].final_sequences_keep)
+    assert generate_words(rules["kat"], 50, seed=1) == generate_words(rules["kat"], 50, seed=1)
@@ -0,0 +1,171 @@
+import gc
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from syllabreak import Syllabreak
+from syllabreak.disk_cache import DiskCache, rule_fingerprint
+from syllabreak.language_rule import LanguageRule
+
+WORDS = "hello world computer syllable breaking international"
+
+
+def test_restart_starts_warm(tmp_path, monkeypatch):
+    first = Syllabreak("-", cache_dir=tmp_path)
+    expected = first.syllabify(WORDS, lang="eng")
+    first.disk_cache.flush()
+
+    def fail(self, word, rule):
+        raise AssertionError(f"{word} was syllabified again")
+
+    monkeypatch.setattr(Syllabreak, "_syllabify_word", fail)
+    second = Syllabreak("-", shape_cache_size=0, cache_dir=tmp_path)
+    assert second.syllabify(WORDS, lang="eng") == expected
+    assert second.syllabify(WORDS.upper(), lang="eng") == expected.upper()
+
+
+def test_unflushed_entries_are_written_on_collection(tmp_path):
+    s = Syllabreak(cache_dir=tmp_path)
+    s.syllabify("hello", lang="eng")
+    path = s.disk_cache.path(s._get_rule_by_lang("eng"))
+    del s
+
+    assert DiskCache(tmp_path).get("hello", Syllabreak()._get_rule_by_lang("eng")) == [3]
+    assert path.exists()
+
+
+def test_changed_rules_do_not_reuse_entries(tmp_path):
+    rule = Syllabreak()._get_rule_by_lang("eng")
+    cache = DiskCache(tmp_path)
+    cache.put("hello", rule, [3])
+    cache.flush()
+
+    changed = LanguageRule({"lang": "eng", "vowels": "aeiou", "consonants": "hl", "sonorants": "l"})
+    assert rule_fingerprint(changed) != rule_fingerprint(rule)
+    assert DiskCache(tmp_path).get("hello", changed) is None
+    assert DiskCache(tmp_path).get("hello", rule) == [3]
+
+
+def test_damaged_lines_are_skipped(tmp_path):
+    rule = Syllabreak()._get_rule_by_lang("eng")
+    cache = DiskCache(tmp_path)
+    cache.put("hello", rule, [3])
+    cache.flush()
+    path = cache.path(rule)
+    with open(path, "ab") as f:
+        f.write(b"garbage\nworld\t9\t00000000\n\xff\xfe\ncompu")
+
+    cache = DiskCache(tmp_path)
+    cache.put("computer", rule, [3, 5])
+    cache.flush()
+
+    reloaded = DiskCache(tmp_path)
+    assert reloaded.get("hello", rule) == [3]
+    assert reloaded.get("world", rule) is None
+    assert reloaded.get("computer", rule) == [3, 5]
+
+
+def test_corpus_executor_uses_cache(tmp_path):
+    s = Syllabreak("-", cache_dir=tmp_path)
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        result = s.syllabify_corpus([WORDS], lang="eng", executor=executor)
+    assert result == [Syllabreak("-").syllabify(WORDS, lang="eng")]
+    assert s.disk_cache.get("computer", s._get_rule_by_lang("eng")) == [3, 5]
+
+
+def _syllabify_in_process(cache_dir, text):
+    s = Syllabreak("-", cache_dir=cache_dir)
+    result = s.syllabify(text, lang="eng")
+    s.disk_cache.flush()
+    return result
+
+
+def test_processes_share_cache_dir(tmp_path):
+    texts = [f"{WORDS} {word}" for word in "alpha beta gamma delta epsilon zeta eta theta".split()]
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(_syllabify_in_process, [tmp_path] * len(texts), texts))
+
+    s = Syllabreak("-")
+    assert results == [s.syllabify(text, lang="eng") for text in texts]
+    warm = Syllabreak("-", cache_dir=tmp_path)
+    rule = warm._get_rule_by_lang("eng")
+    for word in ("hello", "international", "epsilon", "theta"):
+        assert warm.disk_cache.get(word, rule) == s._syllabify_word(word, rule)
+
+
+def test_long_words_are_not_recorded(tmp_path):
+    s = Syllabreak(cache_dir=tmp_path)
+    blob = "QmFzZTY0" * 20
+    s.syllabify(f"hello {blob}", lang="eng")
+    s.disk_cache.flush()
+
+    rule = s._get_rule_by_lang("eng")
+    reloaded = DiskCache(tmp_path)
+    assert reloaded.get("hello", rule) == [3]
+    assert reloaded.get(blob.lower(), rule) is None
+
+
+def test_threads_share_cache(tmp_path):
+    s = Syllabreak("-", cache_dir=tmp_path)
+    s.disk_cache.flush_every = 3
+    texts = [f"{WORDS} {i}" + " extra" * (i % 5) for i in range(200)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda text: s.syllabify(text, lang="eng"), texts))
+    s.disk_cache.flush()
+
+    assert results == [Syllabreak("-").syllabify(text, lang="eng") for text in texts]
+    lines = s.disk_cache.path(s._get_rule_by_lang("eng")).read_bytes().splitlines()
+    assert len(lines) == len(set(lines)) == len(WORDS.split()) + 1
+
+
+def test_abandoned_files_are_pruned(tmp_path):
+    stale = tmp_path / ("0" * 64 + ".tsv")
+    fresh = tmp_path / ("1" * 64 + ".tsv")
+    stale.write_bytes(b"")
+    fresh.write_bytes(b"")
+    old = time.time() - DiskCache.STALE_AFTER - 60
+    os.utime(stale, (old, old))
+
+    first = Syllabreak(cache_dir=tmp_path)
+    first.syllabify("hello", lang="eng")
+    first.disk_cache.flush()
+    current = first.disk_cache.path(first._get_rule_by_lang("eng"))
+    os.utime(current, (old, old))
+
+    Syllabreak(cache_dir=tmp_path)
+    assert not stale.exists()
+    assert fresh.exists()
+    assert current.exists()
+
+
+def test_loading_is_capped_and_touch_is_best_effort(tmp_path, monkeypatch):
+    rule = Syllabreak()._get_rule_by_lang("eng")
+    cache = DiskCache(tmp_path, flush_every=1000)
+    for word in ("alpha", "beta", "gamma", "delta"):
+        cache.put(word, rule, [2])
+    cache.flush()
+
+    def read_only(*args, **kwargs):
+        raise PermissionError("read-only")
+
+    monkeypatch.setattr(os, "utime", read_only)
+    monkeypatch.setattr(DiskCache, "MAX_ENTRIES", 3)
+    reloaded = DiskCache(tmp_path)
+    reloaded.warm([rule])
+    assert len(reloaded._entries[reloaded.path(rule)]) == 3
+
+
+def test_switching_rule_sets_reuses_entries(tmp_path):
+    s = Syllabreak("-", cache_dir=tmp_path)
+    rule_sets = [
+        {"rules": [{"lang": "eng", "clusters_keep_next": []}]},
+        {"rules": [{"lang": "eng", "suffixes_keep_vre": []}]},
+    ]
+    for i in range(20):
+        s.load_rules(rule_sets[i % 2])
+        s.syllabify("problem", lang="eng")
+    gc.collect()
+
+    # the bundled rules plus one file per distinct eng override
+    assert len(s.disk_cache._entries) == len(s.meta_rule.rules) + 2
+    assert len(s.disk_cache._paths) <= len(s.meta_rule.rules) + 2
@@ -0,0 +1,53 @@
+import pytest
+
+from syllabreak import Syllabreak
+from syllabreak.line_breaker import LineBreaker
+
+TEXT = "The defenestration of understanding requires collaboration between self-service computers."
+
+
+@pytest.mark.parametrize("width", [4, 10, 16, 25, 80])
+def test_lines_fit_and_keep_text(width):
+    lines = Syllabreak().break_lines(TEXT, width, lang="eng")
+
+    for line in lines:
+        # only a single unbreakable syllable may overflow
+        assert len(line) <= width or " " not in line
+    letters = "".join(lines).replace("-", "").replace(" ", "")
+    assert letters == TEXT.replace("-", "").replace(" ", "")
+
+
+def test_hyphenates_at_syllable_boundaries():
+    s = Syllabreak()
+    assert s.break_lines("hello computer", 11, lang="eng") == ["hello com-", "puter"]
+    assert s.break_lines("self-service", 8, lang="eng") == ["self-", "service"]
+
+
+def test_measure_function():
+    # every letter is two units wide
+    lines = Syllabreak().break_lines("hello computer", 20, measure=lambda s: 2 * len(s), lang="eng")
+    assert lines == ["hello com-", "puter"]
+
+
+def test_paragraphs_and_empty_text():
+    s = Syllabreak()
+    assert s.break_lines("hello\n\nworld", 80) == ["hello", "", "world"]
+    assert s.break_lines("", 80) == [""]
+    assert s.break_lines("123 456", 3) == ["123", "456"]
+
+
+def test_only_crossing_words_are_syllabified():
+    seen = []
+
+    def boundaries(chunk):
+        seen.append(chunk)
+        return Syllabreak()._chunk_boundaries(chunk, Syllabreak()._get_rule_by_lang("eng"))
+
+    lines = LineBreaker(20, boundaries).break_lines("the cat sat on the mat with a computer")
+    assert lines == ["the cat sat on the", "mat with a computer"]
+    assert seen == ["mat"]
+
+
+def test_invalid_width():
+    with pytest.raises(ValueError):
+        Syllabreak().break_lines("hello", 0)
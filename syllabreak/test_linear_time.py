@@ -0,0 +1,51 @@
+"""Adversarial inputs must be syllabified in time linear in their length."""
+
+import time
+
+import pytest
+
+from syllabreak import Syllabreak
+
+ADVERSARIAL_WORDS = {
+    "syllabic consonant run": ("srp-latn", lambda n: "a" + "r" * n + "a"),
+    "protected sequence chain": ("eng", lambda n: "a" + "re" * (n // 2)),
+    "modifier run": ("rus", lambda n: "а" + "ь" * n),
+    "separator run": ("rus", lambda n: "с" + "ъ" * n + "е"),
+    "consonant run": ("pol", lambda n: "a" + "szcz" * (n // 4) + "a"),
+    "alternating letters": ("deu", lambda n: "ab" * (n // 2)),
+    "base64-like blob": ("eng", lambda n: ("QmFzZTY0IGJsb2Igb2YgdGV4dA" * n)[:n]),
+}
+
+
+def best_time(s, text, lang):
+    times = []
+    for _ in range(3):
+        start = time.perf_counter()
+        s.syllabify(text, lang=lang)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+@pytest.mark.parametrize("case", ADVERSARIAL_WORDS)
+def test_syllabify_scales_linearly(case):
+    lang, make_word = ADVERSARIAL_WORDS[case]
+    s = Syllabreak("-")
+    small = best_time(s, make_word(4000), lang)
+    large = best_time(s, make_word(32000), lang)
+
+    # 8x the input: linear is ~8x, quadratic would be ~64x
+    assert large / small < 20, f"{case}: {small:.4f}s -> {large:.4f}s"
+
+
+def test_max_word_length_passes_long_words_through():
+    s = Syllabreak("-", max_word_length=10)
+    blob = "QmFzZTY0IGJsb2Igb2YgdGV4dA"
+    assert s.syllabify(f"hello {blob} hello", lang="eng") == f"hel-lo {blob} hel-lo"
+    assert s.syllabify_corpus([f"hello {blob}"], lang="eng") == [f"hel-lo {blob}"]
+
+
+def test_timeout_passes_rest_through():
+    s = Syllabreak("-")
+    text = "hello " * 1000
+    assert s.syllabify(text, lang="eng", timeout=0) == text
+    assert s.syllabify(text, lang="eng", timeout=60) == "hel-lo " * 1000
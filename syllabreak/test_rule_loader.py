@@ -0,0 +1,105 @@
+import pytest
+import yaml
+
+from syllabreak import Syllabreak
+from syllabreak.language_rule import MetaRule
+from syllabreak.rule_table import RuleTable, write_rule_table
+
+TOKI_PONA = {"lang": "tok", "vowels": "aeiou", "consonants": "jklmnpstw", "sonorants": "lmnjw"}
+
+
+def assert_index_matches_rebuild(meta_rule):
+    rebuilt = MetaRule(list(meta_rule.rules), link_rules=False)
+    assert dict(meta_rule._char_index.items()) == rebuilt._char_index
+    assert meta_rule.unique_chars == rebuilt.unique_chars
+
+
+def test_load_new_language():
+    s = Syllabreak("-")
+    s.load_rules({"rules": [TOKI_PONA]})
+    assert s.syllabify("toki pona", lang="tok") == "to-ki po-na"
+    assert "tok" in s.detect_language("toki pona")
+    assert_index_matches_rebuild(s.meta_rule)
+
+
+def test_override_changes_only_given_fields():
+    s = Syllabreak("-")
+    s.load_rules({"rules": [{"lang": "eng", "clusters_keep_next": []}]})
+    assert s.syllabify("problem", lang="eng") == "prob-lem"
+    assert s.syllabify("hello", lang="eng") == "hel-lo"
+    # other instances keep the bundled rules
+    assert Syllabreak("-").syllabify("problem", lang="eng") == "pro-blem"
+    assert_index_matches_rebuild(s.meta_rule)
+
+
+def test_override_updates_unique_chars():
+    s = Syllabreak()
+    assert s.detect_language("čovek")[0] == "srp-latn"
+    # adding "č" to English makes it no longer unique to Serbian Latin
+    eng = s._get_rule_by_lang("eng")
+    s.load_rules({"rules": [{"lang": "eng", "consonants": sorted(eng.consonants) + ["č"]}]})
+    assert "č" not in s.meta_rule.unique_chars["srp-latn"]
+    assert s.detect_language_many(["čovek"])[0][:2] == ["eng", "srp-latn"]
+    assert_index_matches_rebuild(s.meta_rule)
+
+
+def test_load_rules_during_session():
+    s = Syllabreak("-")
+    with s.session(min_chars=10) as session:
+        assert session.syllabify("hello world, how are you") == "hel-lo world, how are you"
+        s.load_rules({"rules": [TOKI_PONA]})
+        # the session keeps detecting with the languages it started with
+        assert session.syllabify("toki pona") == "to-ki po-na"
+        assert "tok" not in session.detect_language("toki pona")
+    assert "tok" in s.detect_language("toki pona")
+
+
+def test_load_from_file(tmp_path):
+    path = tmp_path / "rules.yaml"
+    path.write_text(yaml.safe_dump({"rules": [TOKI_PONA]}), encoding="utf-8")
+    s = Syllabreak("-", languages=["eng"])
+    s.load_rules(path)
+    assert s.syllabify("pona", lang="tok") == "po-na"
+    assert sorted(s.detect_language("kijetesantakalu")) == ["eng", "tok"]
+
+
+def test_compiled_rules_are_shared_between_instances():
+    a = Syllabreak()
+    b = Syllabreak()
+    a.load_rules({"rules": [TOKI_PONA]})
+    b.load_rules({"rules": [TOKI_PONA]})
+    rule_a = a._get_rule_by_lang("tok")
+    rule_b = b._get_rule_by_lang("tok")
+    assert rule_a is not rule_b
+    assert rule_a.vowels is rule_b.vowels
+    assert rule_a.meta is a.meta_rule and rule_b.meta is b.meta_rule
+
+
+def test_compiled_rules_cannot_be_changed_through_an_instance():
+    with pytest.raises(AttributeError):
+        Syllabreak()._get_rule_by_lang("eng").clusters_keep_next.clear()
+    assert Syllabreak("-").syllabify("problem", lang="eng") == "pro-blem"
+
+
+def test_load_into_rule_table(tmp_path):
+    path = tmp_path / "rules.bin"
+    write_rule_table(path, Syllabreak().meta_rule.rules)
+    s = Syllabreak("-", rule_table=RuleTable.open(path))
+    s.load_rules({"rules": [TOKI_PONA, {"lang": "eng", "clusters_keep_next": []}]})
+    assert s.syllabify("problem", lang="eng") == "prob-lem"
+    assert s.syllabify("pona", lang="tok") == "po-na"
+    assert_index_matches_rebuild(s.meta_rule)
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        {"languages": []},
+        {"rules": [{"vowels": "a"}]},
+        {"rules": [{**TOKI_PONA, "vowel": "a"}]},
+        {"rules": [{"lang": "tok", "vowels": "a"}]},
+    ],
+)
+def test_malformed_rule_sets(source):
+    with pytest.raises(ValueError):
+        Syllabreak().load_rules(source)
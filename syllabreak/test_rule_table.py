@@ -0,0 +1,72 @@
+import pytest
+
+from syllabreak import Syllabreak
+from syllabreak.rule_table import RuleTable, compile_rule_table, write_rule_table
+from syllabreak.test_detect_language import load_test_cases as load_detect_cases
+from syllabreak.test_syllabreak import load_test_cases as load_syllabify_cases
+
+
+@pytest.fixture(scope="module")
+def table_path(tmp_path_factory):
+    path = tmp_path_factory.mktemp("rules") / "rules.bin"
+    return write_rule_table(path, Syllabreak().meta_rule.rules)
+
+
+def test_views_match_rule_sets(table_path):
+    original = Syllabreak().meta_rule.rules
+    attached = RuleTable.open(table_path).rules()
+
+    assert [rule.lang for rule in attached] == [rule.lang for rule in original]
+    for rule, view in zip(original, attached):  # noqa: B905 - strict= needs Python 3.10
+        for name in rule.CHAR_FIELDS + rule.STRING_FIELDS:
+            assert set(getattr(view, name)) == getattr(rule, name), f"{rule.lang}.{name}"
+            assert len(getattr(view, name)) == len(getattr(rule, name)), f"{rule.lang}.{name}"
+        assert set(view.all_chars) == rule.all_chars
+        assert view.split_hiatus == rule.split_hiatus
+
+
+def test_syllabify_from_table(table_path):
+    s = Syllabreak("-", rule_table=RuleTable.open(table_path))
+    for _, lang, text, want in load_syllabify_cases():
+        assert s.syllabify(text, lang=lang) == want
+
+
+def test_detect_language_from_table(table_path):
+    original = Syllabreak()
+    s = Syllabreak(rule_table=RuleTable.open(table_path))
+    for text, _ in load_detect_cases():
+        assert s.detect_language(text) == original.detect_language(text)
+    assert s.meta_rule.unique_chars == original.meta_rule.unique_chars
+
+
+def test_table_with_languages(table_path):
+    s = Syllabreak(languages=["srp-latn", "rus"], rule_table=RuleTable.open(table_path))
+    assert s.detect_language("hello") == ["srp-latn"]
+    for rule in s.meta_rule.rules:
+        assert rule.meta is s.meta_rule
+        assert rule.unique_chars == s.meta_rule.unique_chars[rule.lang]
+    s.load_rules({"rules": [{"lang": "rus", "clusters_keep_next": []}]})
+    assert s._get_rule_by_lang("rus").meta is s.meta_rule
+    with pytest.raises(ValueError):
+        Syllabreak(languages=["eng", "xxx"], rule_table=RuleTable.open(table_path))
+
+
+def test_instances_sharing_a_table(table_path):
+    table = RuleTable.open(table_path)
+    a = Syllabreak(rule_table=table, languages=["eng", "tur"])
+    b = Syllabreak(rule_table=table)
+    for s in (a, b):
+        for rule in s.meta_rule.rules:
+            assert rule.meta is s.meta_rule
+            assert rule.unique_chars == s.meta_rule.unique_chars[rule.lang]
+    assert "ö" in a._get_rule_by_lang("tur").unique_chars
+
+
+def test_table_from_bytes():
+    table = RuleTable(compile_rule_table(Syllabreak().meta_rule.rules))
+    assert Syllabreak("-", rule_table=table).syllabify("hello") == "hel-lo"
+
+
+def test_invalid_table():
+    with pytest.raises(ValueError):
+        RuleTable(b"\0" * 64)
@@ -0,0 +1,62 @@
+from syllabreak import Syllabreak
+
+SERBIAN = [
+    "Dobar dan, kako ste danas?",
+    "Moje ime je Marko i živim u Beogradu.",
+    "Volim da čitam knjige.",
+    "Napolju je lepo vreme.",
+]
+
+
+def test_session_locks_language():
+    s = Syllabreak("-")
+    with s.session() as session:
+        session.syllabify(SERBIAN[0])
+        assert session.lang is None
+        session.syllabify(SERBIAN[1])
+        assert session.lang == "srp-latn"
+
+
+def test_session_keeps_short_paragraphs_stable():
+    s = Syllabreak("-")
+    # on its own, a short paragraph without diacritics detects as English
+    assert s.detect_language(SERBIAN[3])[0] == "eng"
+    with s.session() as session:
+        results = [session.syllabify(paragraph) for paragraph in SERBIAN]
+    assert results[3] == s.syllabify(SERBIAN[3], lang="srp-latn")
+
+
+def test_session_rechecks_on_conflicting_letters():
+    s = Syllabreak("-")
+    with s.session(min_chars=10) as session:
+        session.syllabify(SERBIAN[1])
+        assert session.lang == "srp-latn"
+        assert session.syllabify("привет мир, как дела у тебя сегодня?") == s.syllabify(
+            "привет мир, как дела у тебя сегодня?", lang="rus"
+        )
+        assert session.lang == "rus"
+
+
+def test_session_detect_language_and_reset():
+    s = Syllabreak()
+    with s.session(min_chars=10) as session:
+        assert session.detect_language(SERBIAN[1])[0] == "srp-latn"
+        assert session.detect_language("lepo") == ["srp-latn"]
+    assert session.lang is None
+
+
+def test_session_without_letters():
+    with Syllabreak().session() as session:
+        assert session.syllabify("123 !?") == "123 !?"
+        assert session.syllabify("") == ""
+        assert session.detect_language("123") == []
+
+
+def test_session_without_letters_after_lock():
+    s = Syllabreak("-")
+    with s.session(min_chars=10) as session:
+        session.syllabify(SERBIAN[1])
+        assert session.lang == "srp-latn"
+        assert session.detect_language("123 !?") == s.detect_language("123 !?") == []
+        assert session.syllabify("123 !?") == "123 !?"
+        assert session.lang == "srp-latn"
@@ -0,0 +1,90 @@
+import random
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from syllabreak import Syllabreak
+from syllabreak.differential import run_differential
+from syllabreak.shape_cache import ShapeCache, WordShape
+from syllabreak.test_syllabreak import load_test_cases
+
+
+def rule(lang):
+    return Syllabreak()._get_rule_by_lang(lang)
+
+
+def test_cached_boundaries_match_syllabifier():
+    s = Syllabreak(shape_cache_size=1024)
+    corpus = [text for _, _, text, _ in load_test_cases()]
+    report = run_differential(lambda word, rule: s._word_boundaries(word, rule), words_per_rule=2000, corpus=corpus)
+
+    assert report.ok, report.mismatches[:5]
+    assert s.shape_cache.hits > 0
+
+
+def test_shape_abstracts_letters_outside_rule_strings():
+    shape = WordShape(rule("rus"))
+    assert shape.key("вода") == shape.key("жуда")
+    assert shape.key("вода") != shape.key("вдоа")
+
+
+def test_shape_keeps_rule_strings():
+    shape = WordShape(rule("eng"))
+    # "br" is a cluster kept together, "vz" is not
+    assert shape.key("abra") != shape.key("avza")
+    # protected sequence "are" with a light suffix
+    assert shape.key("careless") != shape.key("carelest")
+
+
+def test_words_with_separators_use_coarse_shape():
+    shape = WordShape(rule("rus"))
+    assert shape.key("съел")[0] is False
+    assert shape.key("сел")[0] is True
+
+
+def test_cache_hits_for_new_words_of_known_shape():
+    s = Syllabreak("-", shape_cache_size=1024)
+    assert s.syllabify("вода", lang="rus") == "во-да"
+    misses = s.shape_cache.misses
+    assert s.syllabify("ЖУДА", lang="rus") == "ЖУ-ДА"
+    assert s.shape_cache.misses == misses
+
+
+def test_cache_is_bounded():
+    cache = ShapeCache(maxsize=2)
+    eng = rule("eng")
+    for word in ["hello", "computer", "beautiful"]:
+        cache.get(word, eng, lambda word, rule: [])
+    assert len(cache._entries) == 2
+
+
+def test_long_words_are_not_cached():
+    cache = ShapeCache(maxsize=16)
+    cache.get("a" * (ShapeCache.MAX_WORD_LENGTH + 1), rule("eng"), lambda word, rule: [])
+    assert not cache._entries
+    cache.get("hello", rule("eng"), lambda word, rule: [3])
+    assert all(ord(char) <= 0xFFFF for _, (_, key) in cache._entries for char in key)
+
+
+def test_cache_is_disabled_by_default():
+    s = Syllabreak("-")
+    assert s.shape_cache is None
+    assert s.syllabify("hello") == "hel-lo"
+
+
+def test_cache_is_thread_safe():
+    rng = random.Random(0)
+    texts = [
+        " ".join("".join(rng.choice("abcdeiou") for _ in range(rng.randint(2, 6))) for _ in range(200))
+        for _ in range(400)
+    ]
+    expected = [Syllabreak("-", shape_cache_size=0).syllabify(text, lang="eng") for text in texts]
+    s = Syllabreak("-", shape_cache_size=8)
+
+    # switch threads often so that lookups and evictions interleave
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            assert list(executor.map(lambda text: s.syllabify(text, lang="eng"), texts)) == expected
+    finally:
+        sys.setswitchinterval(interval)
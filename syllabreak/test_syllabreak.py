@@ -1,3 +1,4 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
@@ -28,3 +29,76 @@ def test_syllabify(section, lang, text, want):
     else:
         result = syllabifier.syllabify(text)
     assert result == want, f"[{section}] Failed for '{text}': got '{result}', want '{want}'"
+
+
+def corpus_documents():
+    documents = [text for _, _, text, _ in load_test_cases()]
+    return documents + ["Hello HELLO hello", "", "123 !?", "İstanbul istanbul"]
+
+
+def test_syllabify_corpus_matches_syllabify():
+    s = Syllabreak("-")
+    documents = corpus_documents()
+    assert s.syllabify_corpus(documents) == [s.syllabify(doc) for doc in documents]
+
+
+def test_syllabify_corpus_with_lang():
+    s = Syllabreak("-")
+    assert s.syllabify_corpus(["Problem", "PROBLEM problem"], lang="srp-latn") == ["Prob-lem", "PROB-LEM prob-lem"]
+
+
+@pytest.mark.parametrize("executor_class", [ThreadPoolExecutor, ProcessPoolExecutor])
+def test_syllabify_corpus_with_executor(executor_class):
+    s = Syllabreak("-")
+    documents = corpus_documents()
+    with executor_class(max_workers=2) as executor:
+        assert s.syllabify_corpus(documents, executor=executor) == [s.syllabify(doc) for doc in documents]
+
+
+def rebuild(text, records, hyphen="-"):
+    """Reassemble syllabify output from iter_syllables records."""
+    result = []
+    prev = 0
+    for record in records:
+        result.append(text[prev : record.start])
+        result.append(hyphen.join(text[start:end] for start, end in record.syllables))
+        prev = record.end
+    result.append(text[prev:])
+    return "".join(result)
+
+
+def test_iter_syllables_matches_syllabify():
+    s = Syllabreak("-")
+    for doc in corpus_documents():
+        assert rebuild(doc, s.iter_syllables(doc)) == s.syllabify(doc)
+
+
+def test_iter_syllables_records():
+    records = list(Syllabreak().iter_syllables("Say hello, world!", lang="eng"))
+    assert [(r.start, r.end, r.lang) for r in records] == [(0, 3, "eng"), (4, 9, "eng"), (11, 16, "eng")]
+    assert records[1].syllables == [(4, 7), (7, 9)]
+    assert records[2].syllables == [(11, 16)]
+
+
+def test_iter_syllables_is_lazy(monkeypatch):
+    s = Syllabreak(shape_cache_size=0)
+    calls = []
+    original = Syllabreak._syllabify_word
+    monkeypatch.setattr(Syllabreak, "_syllabify_word", lambda self, w, r: calls.append(w) or original(self, w, r))
+
+    records = s.iter_syllables("hello world " * 10000, lang="eng")
+    assert next(records).syllables == [(0, 3), (3, 5)]
+    assert calls == ["hello"]
+
+
+def test_iter_syllables_unknown_letters():
+    records = list(Syllabreak().iter_syllables("日本語"))
+    assert [(r.lang, r.syllables) for r in records] == [(None, [(0, 3)])]
+    # the language is that of the whole text
+    records = list(Syllabreak().iter_syllables("hello 日本語 world"))
+    assert [(r.lang, r.syllables) for r in records][1] == ("eng", [(6, 9)])
+
+
+def test_iter_syllables_unsupported_lang():
+    with pytest.raises(ValueError):
+        Syllabreak().iter_syllables("hello", lang="xyz")
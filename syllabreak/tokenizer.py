@@ -46,26 +46,31 @@ class Tokenizer:
         return self.tokens
 
     def _try_match_left_modifier(self) -> bool:
-        """Try to match a left-attaching modifier at current position."""
+        """Try to match a run of left-attaching modifiers at current position."""
         char = self.word_lower[self.pos]
         if char not in self.rule.modifiers_attach_left:
             return False
 
+        # Consume the whole run at once so long runs do not grow a surface char by char
+        end = self.pos + 1
+        while end < len(self.word) and self.word_lower[end] in self.rule.modifiers_attach_left:
+            end += 1
+
         if self.tokens:
-            self.tokens[-1].surface += self.word[self.pos]
-            self.tokens[-1].end_idx = self.pos + 1
+            self.tokens[-1].surface += self.word[self.pos : end]
+            self.tokens[-1].end_idx = end
             self.tokens[-1].is_modifier = True
         else:
             self.tokens.append(
                 Token(
-                    surface=self.word[self.pos],
+                    surface=self.word[self.pos : end],
                     token_class=TokenClass.OTHER,
                     is_modifier=True,
                     start_idx=self.pos,
-                    end_idx=self.pos + 1,
+                    end_idx=end,
                 )
             )
-        self.pos += 1
+        self.pos = end
         return True
 
     def _try_match_separator(self) -> bool:
@@ -1,3 +1,5 @@
+import heapq
+import itertools
 from typing import Optional
 
 from .language_rule import LanguageRule
@@ -5,7 +7,12 @@ from .tokenizer import Token, TokenClass, Tokenizer
 
 
 class WordSyllabifier:
-    """Handles syllabification of a single word."""
+    """Handles syllabification of a single word.
+
+    Runs in O(n) time for a word of n characters: tokenization, nucleus detection
+    and boundary placement each look at every token a bounded number of times, and
+    suffix checks compare in place against a lowercased copy made once per word.
+    """
 
     def __init__(self, word: str, rule: LanguageRule, soft_hyphen: str):
         self.word = word
@@ -13,6 +20,14 @@ class WordSyllabifier:
         self.soft_hyphen = soft_hyphen
         self.tokens = self._tokenize()
         self.nuclei = self._find_nuclei()
+        self._lowered_cache: Optional[tuple[str, list[int]]] = None
+
+    def _lowered(self) -> tuple[str, list[int]]:
+        """Lowercased token surfaces joined, with the offset where each token starts (plus the end)."""
+        if self._lowered_cache is None:
+            lowered = [token.surface.lower() for token in self.tokens]
+            self._lowered_cache = ("".join(lowered), list(itertools.accumulate(map(len, lowered), initial=0)))
+        return self._lowered_cache
 
     def _tokenize(self) -> list[Token]:
         """Tokenize the word according to language rules."""
@@ -48,39 +63,23 @@ class WordSyllabifier:
         # (e.g., Serbian "r" in "prljav" -> "pr-ljav")
         # Must have consonant on both sides AND have at least one consonant
         # between it and the nearest vowel on BOTH sides (not just one)
+        # A neighbouring consonant on each side is already such a buffer: the nearest
+        # vowel (or word edge) is then at least two tokens away, so no scan is needed
         if self.rule.syllabic_consonants and nuclei:
             syllabic_nuclei = []
-            for i, token in enumerate(self.tokens):
+            for i in range(1, len(self.tokens) - 1):
+                token = self.tokens[i]
                 if token.token_class != TokenClass.CONSONANT:
                     continue
                 if token.surface.lower() not in self.rule.syllabic_consonants:
                     continue
-                # Check if surrounded by consonants (not adjacent to vowels)
-                prev_is_consonant = (i == 0) or (self.tokens[i - 1].token_class == TokenClass.CONSONANT)
-                next_is_consonant = (i == len(self.tokens) - 1) or (self.tokens[i + 1].token_class == TokenClass.CONSONANT)
-                if not (prev_is_consonant and next_is_consonant):
-                    continue
-                # Find distance to nearest vowel before (or word start)
-                dist_to_prev_vowel = i + 1  # default: distance to word start
-                for j in range(i - 1, -1, -1):
-                    if self.tokens[j].token_class == TokenClass.VOWEL:
-                        dist_to_prev_vowel = i - j
-                        break
-                # Find distance to nearest vowel after (or word end)
-                dist_to_next_vowel = len(self.tokens) - i  # default: distance to word end
-                for j in range(i + 1, len(self.tokens)):
-                    if self.tokens[j].token_class == TokenClass.VOWEL:
-                        dist_to_next_vowel = j - i
-                        break
-                # Syllabic consonant only if there's at least one consonant between
-                # it and nearest vowel on BOTH sides (distance > 1)
-                has_buffer_before = dist_to_prev_vowel > 1
-                has_buffer_after = dist_to_next_vowel > 1
-                if has_buffer_before and has_buffer_after:
+                prev_is_consonant = self.tokens[i - 1].token_class == TokenClass.CONSONANT
+                next_is_consonant = self.tokens[i + 1].token_class == TokenClass.CONSONANT
+                if prev_is_consonant and next_is_consonant:
                     syllabic_nuclei.append(i)
-            # Merge syllabic consonant nuclei with vowel nuclei
+            # Merge syllabic consonant nuclei with vowel nuclei (both sorted, disjoint)
             if syllabic_nuclei:
-                nuclei = sorted(set(nuclei + syllabic_nuclei))
+                nuclei = list(heapq.merge(nuclei, syllabic_nuclei))
 
         if nuclei:
             return nuclei
@@ -171,26 +170,31 @@ class WordSyllabifier:
 
         # Check for protected sequences (like -are, -ere, -ore, -ure, -ire)
         if self.rule.final_sequences_keep:
+            word_lower, starts = self._lowered()
             # Build the sequence from current vowel nucleus through next nucleus
-            sequence = "".join(t.surface.lower() for t in self.tokens[nk:nk1 + 1])
+            sequence = word_lower[starts[nk] : starts[nk1 + 1]]
             if sequence in self.rule.final_sequences_keep:
-                # Get the rest of the word starting from next nucleus (includes the vowel)
-                rest_with_vowel = "".join(t.surface.lower() for t in self.tokens[nk1:])
-                rest_after_vowel = "".join(t.surface.lower() for t in self.tokens[nk1 + 1:])
+                # The rest of the word starts at the next nucleus (includes the vowel);
+                # it is compared in place instead of being sliced out at every gap
+                rest_start = starts[nk1]
+                rest_after_vowel_start = starts[nk1 + 1]
 
                 # Check if followed by a breaking suffix (par-ent, ad-her-ent)
                 # The suffix starts from the next vowel: "ent" in "par-ent"
                 if self.rule.suffixes_break_vre:
                     for suffix in self.rule.suffixes_break_vre:
-                        if rest_with_vowel == suffix or rest_with_vowel.startswith(suffix):
+                        if word_lower.startswith(suffix, rest_start):
                             # Split after consonant = before next nucleus
                             return nk1
 
                 # Check if at word end or followed by light suffix (care, care-less)
                 is_at_end = nk1 == len(self.tokens) - 1
                 has_light_suffix = False
-                if self.rule.suffixes_keep_vre and rest_after_vowel:
-                    has_light_suffix = rest_after_vowel in self.rule.suffixes_keep_vre
+                rest_after_vowel_len = len(word_lower) - rest_after_vowel_start
+                if self.rule.suffixes_keep_vre and rest_after_vowel_len:
+                    # Only a rest no longer than the longest suffix can match
+                    if rest_after_vowel_len <= max(len(suffix) for suffix in self.rule.suffixes_keep_vre):
+                        has_light_suffix = word_lower[rest_after_vowel_start:] in self.rule.suffixes_keep_vre
 
                 if is_at_end or has_light_suffix:
                     # Don't split - return None to indicate no boundary
@@ -259,21 +263,28 @@ class WordSyllabifier:
 
         return boundaries
 
+    def boundary_offsets(self) -> list[int]:
+        """Character offsets in the word where syllable boundaries go, ascending."""
+        if len(self.nuclei) < 2:
+            return []
+        return [self.tokens[i].start_idx for i in self._place_boundaries()]
+
     def syllabify(self) -> str:
         """Perform syllabification and return the word with soft hyphens."""
-        if len(self.nuclei) < 2:
-            return self.word
+        return insert_hyphens(self.word, self.boundary_offsets(), self.soft_hyphen)
 
-        boundaries = self._place_boundaries()
-        if not boundaries:
-            return self.word
 
-        result = []
-        boundary_set = set(boundaries)
+def insert_hyphens(word: str, offsets: list[int], soft_hyphen: str) -> str:
+    """Insert soft hyphens into the word at the given ascending character offsets."""
+    if not offsets:
+        return word
 
-        for i, token in enumerate(self.tokens):
-            if i in boundary_set:
-                result.append(self.soft_hyphen)
-            result.append(token.surface)
+    result = []
+    prev = 0
+    for offset in offsets:
+        result.append(word[prev:offset])
+        result.append(soft_hyphen)
+        prev = offset
+    result.append(word[prev:])
 
-        return "".join(result)
+    return "".join(result)